@@ -4,20 +4,41 @@ This module defines a small web server that powers the OLASIS 4.0
 interface with pagination support.
 """
 
+import hashlib
 import logging
 import os
 import re
 import secrets
+import threading
+import time
+from concurrent.futures import wait
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
+from xml.etree.ElementTree import ParseError, iterparse
 
-from olasis import OlaBot, search_articles, search_specialists
+from olasis import OlaBot
+from olasis.cache import TTLCache
 from olasis.dependencies import (
+    optional_flask_compress,
     require_dotenv_loader,
     require_flask,
-    require_requests,
 )
+from olasis.json_provider import install_json_provider
+from olasis.prompt_engineering import ChatSuggestions
+from olasis.search import (
+    MAX_PAGE,
+    PER_PAGE,
+    UPSTREAM_POOL as _UPSTREAM_POOL,
+    normalise_query,
+    paginate,
+    query_key,
+    search_all,
+)
+from olasis.utils import SESSION as http_session
 from jinja2 import TemplateNotFound
+from werkzeug.http import http_date, is_resource_modified, quote_etag
 
 flask = require_flask()
 Flask = flask.Flask
@@ -28,7 +49,6 @@ url_for = flask.url_for
 abort = flask.abort
 stream_with_context = flask.stream_with_context
 
-requests = require_requests()
 load_dotenv = require_dotenv_loader()
 
 dotenv_loaded = load_dotenv()
@@ -36,6 +56,22 @@ dotenv_loaded = load_dotenv()
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__, template_folder="templates", static_folder="static")
+install_json_provider(app)
+
+flask_compress = optional_flask_compress()
+if flask_compress is not None:
+    # Brotli first, gzip for older clients. Only the textual mimetypes are
+    # compressed (videos are not), and streamed responses (video, SSE) are
+    # left alone so chat deltas are flushed as soon as they are produced.
+    app.config.update(
+        COMPRESS_ALGORITHM=["br", "gzip"],
+        COMPRESS_BR_LEVEL=4,
+        COMPRESS_LEVEL=6,
+        COMPRESS_MIN_SIZE=500,
+        COMPRESS_STREAMS=False,
+    )
+    flask_compress.Compress(app)
+
 
 def _is_production_environment() -> bool:
     """Best-effort detection of production/staging deployment."""
@@ -47,8 +83,13 @@ def _is_production_environment() -> bool:
     return False
 
 
+_warned_ephemeral_secret = False
+
+
 def _resolve_secret_key() -> str:
-    """Return a strong secret key, warning locally if unset."""
+    """Return a strong secret key, warning locally (once) if unset."""
+
+    global _warned_ephemeral_secret
 
     configured_key = os.getenv("SECRET_KEY")
     if configured_key:
@@ -60,15 +101,18 @@ def _resolve_secret_key() -> str:
             "SECRET_KEY environment variable must be configured in production."
         )
 
-    generated_key = secrets.token_urlsafe(32)
+    # Hex is a valid session key and skips token_urlsafe's base64 step.
+    generated_key = secrets.token_bytes(32).hex()
 
-    if not running_tests:
+    if not running_tests and not _warned_ephemeral_secret:
+        _warned_ephemeral_secret = True
         logger.warning(
             "SECRET_KEY was not set – using an ephemeral value for local development."
         )
 
     return generated_key
 
+
 def _resolve_google_api_key() -> str | None:
     """Return a configured Gemini API key with helpful logging."""
 
@@ -96,12 +140,28 @@ def _resolve_google_api_key() -> str | None:
 app.config.update(
     SECRET_KEY=_resolve_secret_key(),
 )
-olabot = OlaBot(
-    api_key=_resolve_google_api_key(),
-    model="gemini-2.5-flash",
-    temperature=0.7,
-    enable_prompt_engineering=True
-)
+_OLABOT_LOCK = threading.Lock()
+_olabot = None
+
+
+def get_olabot() -> OlaBot:
+    """Create the shared OLABOT on first use.
+
+    Building the bot resolves the API key and opens the Gemini client, which
+    workers that only serve search, stats or static pages never need.
+    """
+
+    global _olabot
+    if _olabot is None:
+        with _OLABOT_LOCK:
+            if _olabot is None:
+                _olabot = OlaBot(
+                    api_key=_resolve_google_api_key(),
+                    model="gemini-2.5-flash",
+                    temperature=0.7,
+                    enable_prompt_engineering=True
+                )
+    return _olabot
 
 # -------------------------
 # Tratamento de erros
@@ -119,74 +179,182 @@ def internal_error(error):
 # -------------------------
 @app.route("/")
 def index():
-    return render_template("index.html")
+    html, etag = _index_html()
+    return _cached_page_response(html, etag, max_age=300)
+
+
+# index.html has no per-request content (only url_for links), so render it
+# once per process and let clients revalidate with the ETag.
+@lru_cache(maxsize=1)
+def _index_html() -> tuple[str, str]:
+    return _with_etag(render_template("index.html"))
+
+
+def _weak_etag(data: bytes) -> str:
+    digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+    # Weak: the same body may be sent br, gzip or identity encoded.
+    return quote_etag(digest, weak=True)
+
+
+def _with_etag(html: str) -> tuple[str, str]:
+    """Pair a rendered page with its ETag."""
+
+    return html, _weak_etag(html.encode("utf-8"))
+
+
+def _conditional_response(body, etag: str, cache_control: str, mimetype: str = "text/html"):
+    """Return ``body`` with caching headers, or 304 if the client has it."""
+
+    headers = {"Cache-Control": cache_control, "ETag": etag}
+    if not is_resource_modified(request.environ, etag=etag):
+        return flask.Response(status=304, headers=headers)
+    return app.response_class(body, mimetype=mimetype, headers=headers)
+
+
+def _cached_page_response(html: str, etag: str, *, max_age: int):
+    return _conditional_response(html, etag, f"public, max-age={max_age}")
+
+
+# API payloads are stable for at least a minute (stats for an hour, search
+# results for five), so let browsers and proxies reuse and revalidate them.
+_API_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
+
+def _cacheable_json(body: bytes, etag: str | None = None):
+    return _conditional_response(
+        body, etag or _weak_etag(body), _API_CACHE_CONTROL, app.json.mimetype
+    )
 
 
 _VIDEOS_DIRECTORY = Path(app.root_path) / "static" / "videos"
-_MAX_RANGE_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MiB, safely below Cloud Run limits
+_MAX_RANGE_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MiB default for open-ended ranges
 
-def _resolve_tutorial_path(lang: str) -> Path:
-    """Return the filesystem path for the requested tutorial video."""
 
-    language_map = {
-        "es": "ESP_Tutorial_OLASIS.mp4",
-        "en": "EN_Tutorial_OLASIS.mp4",
-        "pt": "PT_Tutorial_OLASIS.mp4",
-    }
+def _resolve_stream_chunk_size() -> int:
+    """Return the read size used when streaming videos, honouring overrides."""
+
+    raw_value = os.getenv("OLASIS_STREAM_CHUNK_SIZE", "").strip()
+    if raw_value:
+        try:
+            configured = int(raw_value)
+        except ValueError:
+            logger.warning(
+                "OLASIS_STREAM_CHUNK_SIZE=%r is not an integer – using the default.",
+                raw_value,
+            )
+        else:
+            if configured > 0:
+                return configured
+            logger.warning(
+                "OLASIS_STREAM_CHUNK_SIZE must be positive – using the default."
+            )
+    return 64 * 1024
+
+
+_STREAM_CHUNK_SIZE = _resolve_stream_chunk_size()
+
+_TUTORIAL_CACHE_CONTROL = "public, max-age=86400"
+
+_TUTORIAL_FILENAMES = {
+    "es": "ESP_Tutorial_OLASIS.mp4",
+    "en": "EN_Tutorial_OLASIS.mp4",
+    "pt": "PT_Tutorial_OLASIS.mp4",
+}
+
+
+def _load_tutorial_cache() -> dict[str, tuple[Path, int, dict[str, str]]]:
+    """Resolve every tutorial video once, keeping its path, size and headers.
+
+    The videos are immutable static assets, so resolving and stat-ing them
+    at import time spares each request those filesystem calls. The cache
+    validators (``ETag``/``Last-Modified``) are derived from the same stat.
+    """
+
+    cache: dict[str, tuple[Path, int, dict[str, str]]] = {}
+    for lang, filename in _TUTORIAL_FILENAMES.items():
+        video_path = (_VIDEOS_DIRECTORY / filename).resolve()
+        if not video_path.is_file() or _VIDEOS_DIRECTORY not in video_path.parents:
+            logger.warning("Vídeo tutorial %r não encontrado em %s", lang, video_path)
+            continue
+        stat = video_path.stat()
+        cache_headers = {
+            "Cache-Control": _TUTORIAL_CACHE_CONTROL,
+            "ETag": quote_etag(f"{stat.st_size:x}-{stat.st_mtime_ns:x}", weak=True),
+            "Last-Modified": http_date(stat.st_mtime),
+        }
+        cache[lang] = (video_path, stat.st_size, cache_headers)
+    return cache
 
-    filename = language_map.get(lang.lower())
-    if not filename:
-        abort(404)
 
-    video_path = (_VIDEOS_DIRECTORY / filename).resolve()
-    if not video_path.is_file() or _VIDEOS_DIRECTORY not in video_path.parents:
-        print(f"📂 Verificando caminho: {_VIDEOS_DIRECTORY}")
-        print(f"🎬 Tentando abrir: {video_path}")
-        print(f"✅ Existe arquivo? {video_path.exists()}")
+_TUTORIAL_CACHE = _load_tutorial_cache()
+
+
+def _resolve_tutorial_path(lang: str) -> tuple[Path, int, dict[str, str]]:
+    """Return the path, size and cache headers of the requested tutorial video."""
+
+    cached = _TUTORIAL_CACHE.get(lang)
+    if cached is None:
         abort(404)
 
-    return video_path
+    return cached
+
+
+def _parse_range_header(range_header: str) -> tuple[int, int | None] | None:
+    """Parse the first ``bytes=start-[end]`` spec of a Range header.
 
+    The grammar is fixed, so plain string operations are used instead of
+    the regex engine.  Only the first range of a multi-range header is
+    considered; suffix ranges (``bytes=-N``) are not supported.
+    """
 
-def _build_range_response(video_path: Path, range_header: str):
+    if not range_header.startswith("bytes="):
+        return None
+
+    spec = range_header[6:].split(",", 1)[0]
+    start_text, _, end_text = spec.partition("-")
+    if not start_text.isdecimal():
+        return None
+    if not end_text:
+        return int(start_text), None
+    if not end_text.isdecimal():
+        return None
+    # Honour the exact range requested; MP4 seeking relies on it.
+    return int(start_text), int(end_text)
+
+
+def _build_range_response(video_path: Path, file_size: int, range_header: str):
     """Return a partial content response for Range/seek support."""
 
-    match = re.match(r"bytes=(\d+)-(\d*)", range_header)
-    if not match:
+    parsed = _parse_range_header(range_header)
+    if parsed is None:
         return None
 
-    file_size = video_path.stat().st_size
-    start = int(match.group(1))
+    start, end = parsed
     if start >= file_size:
         response = flask.Response(status=416)
         response.headers["Accept-Ranges"] = "bytes"
         response.headers["Content-Range"] = f"bytes */{file_size}"
         return response
 
-    end_group = match.group(2)
-    if end_group:
-        end = int(end_group)
-    else:
-        end = start + _MAX_RANGE_CHUNK_SIZE - 1
-
-    end = min(end, file_size - 1)
-
-    if end - start + 1 > _MAX_RANGE_CHUNK_SIZE:
+    if end is None:
+        # Open-ended ranges (``bytes=start-``) are bounded so a single
+        # request never streams the whole remainder of a large file.
         end = start + _MAX_RANGE_CHUNK_SIZE - 1
 
     end = min(end, file_size - 1)
     if start > end:
         return None
 
-    chunk_size = 8192
     length = end - start + 1
 
     def generate():
-        with video_path.open("rb") as file_obj:
+        # Unbuffered: we already read in large blocks, so io.BufferedReader
+        # would only add an extra copy through its own 8 KiB buffer.
+        with video_path.open("rb", buffering=0) as file_obj:
             file_obj.seek(start)
             remaining = length
             while remaining > 0:
-                read_length = min(chunk_size, remaining)
+                read_length = min(_STREAM_CHUNK_SIZE, remaining)
                 data = file_obj.read(read_length)
                 if not data:
                     break
@@ -202,54 +370,78 @@ def _build_range_response(video_path: Path, range_header: str):
     return response
 
 
-def _build_full_response(video_path: Path):
+def _build_full_response(video_path: Path, file_size: int):
     """Return a streaming response for the entire video file."""
 
-    file_size = video_path.stat().st_size
-    if file_size > _MAX_RANGE_CHUNK_SIZE:
-        synthetic_range = f"bytes=0-{_MAX_RANGE_CHUNK_SIZE - 1}"
-        limited_response = _build_range_response(video_path, synthetic_range)
-        if limited_response is not None:
-            return limited_response
-
-    chunk_size = 8192
+    file_wrapper = request.environ.get("wsgi.file_wrapper")
+    if file_wrapper is not None:
+        # Let the WSGI server (gunicorn, waitress, ...) send the file with
+        # sendfile(2) instead of copying every block through Python.
+        response = flask.Response(
+            file_wrapper(video_path.open("rb"), _STREAM_CHUNK_SIZE),
+            mimetype="video/mp4",
+            direct_passthrough=True,
+        )
+    else:
+        def generate():
+            with video_path.open("rb", buffering=0) as file_obj:
+                while True:
+                    data = file_obj.read(_STREAM_CHUNK_SIZE)
+                    if not data:
+                        break
+                    yield data
 
-    def generate():
-        with video_path.open("rb") as file_obj:
-            while True:
-                data = file_obj.read(chunk_size)
-                if not data:
-                    break
-                yield data
+        response = flask.Response(stream_with_context(generate()), mimetype="video/mp4")
 
-    response = flask.Response(stream_with_context(generate()), mimetype="video/mp4")
     response.headers["Content-Length"] = str(file_size)
     response.headers["Accept-Ranges"] = "bytes"
     return response
 
 
-@app.route("/media/tutorial/<lang>", methods=["GET", "HEAD"])
+# The ``any`` converter only matches the known (lowercase) language codes, so
+# unknown languages 404 in routing and the handler needs no normalisation.
+_TUTORIAL_RULE = "/media/tutorial/<any({}):lang>".format(", ".join(_TUTORIAL_FILENAMES))
+
+
+@app.route(_TUTORIAL_RULE, methods=["GET", "HEAD"])
 def tutorial_video(lang: str):
     """Serve tutorial videos with robust range/seek support for streaming."""
 
-    video_path = _resolve_tutorial_path(lang)
+    video_path, file_size, cache_headers = _resolve_tutorial_path(lang)
+    if not is_resource_modified(
+        request.environ,
+        etag=cache_headers["ETag"],
+        last_modified=cache_headers["Last-Modified"],
+    ):
+        return flask.Response(status=304, headers=cache_headers)
+
     range_header = request.headers.get("Range")
 
     if range_header:
-        range_response = _build_range_response(video_path, range_header)
+        range_response = _build_range_response(video_path, file_size, range_header)
         if range_response is not None:
+            range_response.headers.update(cache_headers)
             if request.method == "HEAD":
-                range_response.response = []
-                range_response.direct_passthrough = False
+                _strip_body(range_response)
             return range_response
 
-    response = _build_full_response(video_path)
+    response = _build_full_response(video_path, file_size)
+    response.headers.update(cache_headers)
     if request.method == "HEAD":
-        response.response = []
-        response.direct_passthrough = False
+        _strip_body(response)
     return response
 
 
+def _strip_body(response) -> None:
+    """Drop the body of a HEAD response, releasing any open file handle."""
+
+    body = response.response
+    if hasattr(body, "close"):
+        body.close()
+    response.response = []
+    response.direct_passthrough = False
+
+
 def _cookie_policy_url() -> str:
     """Return the policy URL, falling back gracefully if the route is missing."""
 
@@ -274,7 +466,15 @@ def inject_cookie_policy_url():
 def cookie_policy():
     """Render the cookie policy page."""
 
-    return _render_cookie_policy_template()
+    html, etag = _cookie_policy_html(datetime.utcnow().date())
+    return _cached_page_response(html, etag, max_age=3600)
+
+
+# The page only changes with its "last updated" date, so keep one rendering
+# (and its ETag) per UTC day instead of running Jinja on every request.
+@lru_cache(maxsize=1)
+def _cookie_policy_html(day) -> tuple[str, str]:
+    return _with_etag(_render_cookie_policy_template())
 
 
 def _render_cookie_policy_template():
@@ -296,53 +496,53 @@ def _render_cookie_policy_template():
 # -------------------------
 # Rota: Busca com paginação
 # -------------------------
+# Encoded page bodies, so repeat views of a page skip slicing and JSON
+# serialisation entirely. Shares the result lists' TTL.
+_SEARCH_PAGE_CACHE = TTLCache(maxsize=4096, ttl=300)
+
+
 @app.route("/api/search")
 def api_search():
     """Search API with pagination support - 6 results per page."""
-    query = request.args.get("q", "").strip()
+    query = normalise_query(request.args.get("q", ""))
     if not query:
         return {"error": "No search query provided."}, 400
         
-    page = max(1, int(request.args.get("page", 1)))
-    per_page = 6
-    
-    all_articles = search_articles(query, per_page=50)
-    all_specialists = search_specialists(query, rows=50)
-    
-    # Articles pagination
-    articles_start = (page - 1) * per_page
-    articles_end = articles_start + per_page
-    articles_page = all_articles[articles_start:articles_end]
-    articles_total = len(all_articles)
-    articles_total_pages = (articles_total + per_page - 1) // per_page
-    
-    # Specialists pagination
-    specialists_start = (page - 1) * per_page
-    specialists_end = specialists_start + per_page
-    specialists_page = all_specialists[specialists_start:specialists_end]
-    specialists_total = len(all_specialists)
-    specialists_total_pages = (specialists_total + per_page - 1) // per_page
+    try:
+        page = int(request.args.get("page", 1))
+    except ValueError:
+        return {"error": "Invalid page number."}, 400
+    # Only RESULT_LIMIT results are fetched, so later pages are always empty:
+    # reject them before touching the upstream APIs.
+    if not 1 <= page <= MAX_PAGE:
+        return {"error": "Page out of range."}, 416
+    per_page = PER_PAGE
+
+    page_key = (query_key(query), page)
+    cached_page = _SEARCH_PAGE_CACHE.get(page_key)
+    if cached_page is not None:
+        return _cacheable_json(*cached_page)
+
+    all_articles, all_specialists = search_all(query)
     
-    return {
+    articles_page, articles_info = paginate(all_articles, page, per_page)
+    specialists_page, specialists_info = paginate(all_specialists, page, per_page)
+
+    payload = {
         "articles": articles_page,
         "specialists": specialists_page,
         "pagination": {
             "current_page": page,
             "per_page": per_page,
-            "articles": {
-                "total": articles_total,
-                "total_pages": articles_total_pages,
-                "has_next": page < articles_total_pages,
-                "has_prev": page > 1
-            },
-            "specialists": {
-                "total": specialists_total,
-                "total_pages": specialists_total_pages,
-                "has_next": page < specialists_total_pages,
-                "has_prev": page > 1
-            }
+            "articles": articles_info,
+            "specialists": specialists_info,
         }
-    }, 200
+    }
+    body = app.json.response(payload).get_data()
+    etag = _weak_etag(body)
+    if all_articles or all_specialists:
+        _SEARCH_PAGE_CACHE.set(page_key, (body, etag))
+    return _cacheable_json(body, etag)
 
 # -------------------------
 # Rota: Chat principal
@@ -359,7 +559,7 @@ def api_chat():
         if not message:
             return jsonify({"response": "Por favor, envie uma mensagem válida."}), 400
 
-        reply = olabot.ask(message, lang=lang, reset=reset)
+        reply = get_olabot().ask(message, lang=lang, reset=reset)
 
         return jsonify({
             "response": reply,
@@ -370,6 +570,42 @@ def api_chat():
         logger.error("Erro em /api/chat: %s", exc, exc_info=True)
         return jsonify({"response": "Erro interno no servidor."}), 500
 
+def _sse_event(payload: dict) -> str:
+    """Format ``payload`` as a single server-sent event."""
+
+    return f"data: {app.json.dumps(payload)}\n\n"
+
+
+@app.route("/api/chat/stream", methods=["POST"])
+def api_chat_stream():
+    """Stream the OLABOT reply as server-sent events while Gemini generates it."""
+    data = request.get_json(silent=True) or {}
+    message = data.get("message", "").strip()
+    lang = data.get("lang")
+    reset = bool(data.get("reset"))
+
+    if not message:
+        return jsonify({"response": "Por favor, envie uma mensagem válida."}), 400
+
+    bot = get_olabot()
+
+    def generate():
+        try:
+            for fragment in bot.ask_stream(message, lang=lang, reset=reset):
+                yield _sse_event({"delta": fragment})
+        except Exception as exc:
+            logger.error("Erro em /api/chat/stream: %s", exc, exc_info=True)
+            yield _sse_event({"error": "Erro interno no servidor."})
+        yield _sse_event({"done": True, "lang": lang})
+
+    response = flask.Response(
+        stream_with_context(generate()), mimetype="text/event-stream"
+    )
+    response.headers["Cache-Control"] = "no-cache"
+    # Stop reverse proxies (nginx) from buffering the stream.
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
 # -------------------------
 # Rota: Sugestões de Chat
 # -------------------------
@@ -377,8 +613,6 @@ def api_chat():
 def api_chat_suggestions():
     """Get contextual chat suggestions for OLABOT."""
     try:
-        from olasis.prompt_engineering import ChatSuggestions
-        
         context_type = request.args.get('context', 'general')
         requested_limit = request.args.get('count', request.args.get('limit', 4))
         try:
@@ -421,52 +655,122 @@ def api_chat_suggestions():
 # -------------------------
 # Rota: Estatísticas
 # -------------------------
-@app.route("/api/stats")
-def api_stats():
-    """Get real-time statistics from OpenAlex and ORCID APIs."""
+_ORCID_NUM_FOUND = re.compile(rb"""\bnum-found=["'](\d+)["']""")
+
+
+def _parse_orcid_num_found(content: bytes) -> int | None:
+    """Return the ``num-found`` count from an ORCID search XML response.
+
+    Only one attribute is needed, so a byte-level regex replaces building
+    and walking the whole XML tree. Unusual serialisations fall back to an
+    incremental parse that stops at the first element carrying the count.
+    """
+
+    match = _ORCID_NUM_FOUND.search(content)
+    if match:
+        return int(match.group(1))
+
     try:
-        timeout_seconds = 10
+        for _, element in iterparse(BytesIO(content), events=("start",)):
+            value = element.attrib.get("num-found")
+            if value is not None:
+                return int(value)
+    except (ParseError, ValueError):
+        return None
+    return None
 
-        openalex_resp = requests.get(
-            'https://api.openalex.org/works?filter=type:article&per-page=1',
-            timeout=timeout_seconds,
-        )
-        if openalex_resp.status_code == 200:
-            openalex_data = openalex_resp.json()
-            total_articles = openalex_data.get('meta', {}).get('count', 200000000)
-        else:
-            total_articles = 200000000
-        
 
-        orcid_resp = requests.get(
-            'https://pub.orcid.org/v3.0/search/?q=*&rows=1',
-            timeout=timeout_seconds,
-        )
-        if orcid_resp.status_code == 200:
-            import xml.etree.ElementTree as ET
-            root = ET.fromstring(orcid_resp.content)
-            for elem in root.iter():
-                if 'num-found' in elem.attrib:
-                    total_specialists = int(elem.attrib['num-found'])
-                    break
-            else:
-                total_specialists = 20005117
-        else:
-            total_specialists = 20005117
-        
-        return {
-            "articles": total_articles,
-            "specialists": total_specialists,
-            "last_updated": datetime.now().isoformat()
-        }, 200
-    
+# Share the package's pooled session so stats and search calls reuse the
+# same warm TCP/TLS connections.
+_HTTP = http_session
+
+@lru_cache(maxsize=1)
+def _iso_timestamp(epoch_second: int) -> str:
+    return datetime.fromtimestamp(epoch_second).isoformat()
+
+
+def _iso_now() -> str:
+    """Return the local time as ISO-8601, formatted once per second."""
+
+    return _iso_timestamp(int(time.time()))
+
+
+# The global counts move slowly; refresh them at most once an hour. When an
+# upstream is failing, the degraded payload is kept for a minute so requests
+# don't each wait out the upstream timeout.
+_STATS_CACHE = TTLCache(maxsize=1, ttl=3600)
+_STATS_RETRY_CACHE = TTLCache(maxsize=1, ttl=60)
+
+
+_STATS_TIMEOUT_SECONDS = 10
+# Last known good counts, seeded with long-standing approximations so a cold
+# start with failing upstreams still has something sensible to show.
+_LAST_GOOD_STATS = {"articles": 200000000, "specialists": 20005117}
+
+
+def _fetch_openalex_article_count() -> int | None:
+    response = _HTTP.get(
+        'https://api.openalex.org/works?filter=type:article&per-page=1',
+        headers={'Accept': 'application/json'},
+        timeout=_STATS_TIMEOUT_SECONDS,
+    )
+    if response.status_code != 200:
+        return None
+    return response.json().get('meta', {}).get('count')
+
+
+def _fetch_orcid_specialist_count() -> int | None:
+    response = _HTTP.get(
+        'https://pub.orcid.org/v3.0/search/?q=*&rows=1',
+        headers={'Accept': 'application/vnd.orcid+xml'},
+        timeout=_STATS_TIMEOUT_SECONDS,
+    )
+    if response.status_code != 200:
+        return None
+    return _parse_orcid_num_found(response.content)
+
+
+def _future_value(future) -> int | None:
+    """Return a finished stats future's value, treating any failure as missing."""
+
+    if not future.done():
+        logger.warning("Estatísticas externas excederam o tempo limite")
+        return None
+    try:
+        return future.result()
     except Exception:
-        return {
-            "articles": 200000000,
-            "specialists": 20005117,
-            "last_updated": datetime.now().isoformat(),
-            "error": "Using cached data"
-        }, 200
+        logger.warning("Falha ao obter estatísticas externas", exc_info=True)
+        return None
+
+
+@app.route("/api/stats")
+def api_stats():
+    """Get real-time statistics from OpenAlex and ORCID APIs."""
+    cached = _STATS_CACHE.get("stats") or _STATS_RETRY_CACHE.get("stats")
+    if cached is not None:
+        return _cacheable_json(app.json.response(cached).get_data())
+
+    # Both upstreams are independent, so pay max(t_openalex, t_orcid) rather
+    # than their sum; each falls back on its own if it fails or times out.
+    articles_future = _UPSTREAM_POOL.submit(_fetch_openalex_article_count)
+    specialists_future = _UPSTREAM_POOL.submit(_fetch_orcid_specialist_count)
+    # One shared deadline: a slow OpenAlex must not extend the ORCID wait.
+    wait((articles_future, specialists_future), timeout=_STATS_TIMEOUT_SECONDS)
+    total_articles = _future_value(articles_future)
+    total_specialists = _future_value(specialists_future)
+
+    if total_articles is not None:
+        _LAST_GOOD_STATS["articles"] = total_articles
+    if total_specialists is not None:
+        _LAST_GOOD_STATS["specialists"] = total_specialists
+
+    stats = {**_LAST_GOOD_STATS, "last_updated": _iso_now()}
+    if total_articles is None or total_specialists is None:
+        stats["error"] = "Using cached data"
+        _STATS_RETRY_CACHE.set("stats", stats)
+    else:
+        _STATS_CACHE.set("stats", stats)
+    return _cacheable_json(app.json.response(stats).get_data())
 
 # -------------------------
 # Execução local
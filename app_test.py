@@ -4,12 +4,14 @@ import os
 from datetime import datetime
 from flask import Flask, jsonify, render_template, request, url_for
 from dotenv import load_dotenv
-from olasis import search_articles, search_specialists
+from olasis.search import MAX_PAGE, PER_PAGE, normalise_query, paginate, search_all
+from olasis.json_provider import install_json_provider
 from jinja2 import TemplateNotFound
 
 load_dotenv()
 
 app = Flask(__name__, template_folder="templates", static_folder="static")
+install_json_provider(app)
 
 @app.route("/")
 def index():
@@ -62,50 +64,35 @@ def _render_cookie_policy_template():
 @app.route("/api/search")
 def api_search():
     """Search API with pagination support - 6 results per page."""
-    query = request.args.get("q", "").strip()
+    query = normalise_query(request.args.get("q", ""))
     if not query:
         return {"error": "No search query provided."}, 400
         
     # Get pagination parameters
-    page = max(1, int(request.args.get("page", 1)))
-    per_page = 6
-    
-    # Fetch all results first
-    all_articles = search_articles(query, per_page=50)
-    all_specialists = search_specialists(query, rows=50)
-    
-    # Calculate pagination for articles
-    articles_start = (page - 1) * per_page
-    articles_end = articles_start + per_page
-    articles_page = all_articles[articles_start:articles_end]
-    articles_total = len(all_articles)
-    articles_total_pages = (articles_total + per_page - 1) // per_page
+    try:
+        page = int(request.args.get("page", 1))
+    except ValueError:
+        return {"error": "Invalid page number."}, 400
+    # Only RESULT_LIMIT results are fetched, so later pages are always empty:
+    # reject them before touching the upstream APIs.
+    if not 1 <= page <= MAX_PAGE:
+        return {"error": "Page out of range."}, 416
+    per_page = PER_PAGE
     
-    # Calculate pagination for specialists  
-    specialists_start = (page - 1) * per_page
-    specialists_end = specialists_start + per_page
-    specialists_page = all_specialists[specialists_start:specialists_end]
-    specialists_total = len(all_specialists)
-    specialists_total_pages = (specialists_total + per_page - 1) // per_page
+    # Fetch all results first (cached per query, so later pages are free)
+    all_articles, all_specialists = search_all(query)
     
+    articles_page, articles_info = paginate(all_articles, page, per_page)
+    specialists_page, specialists_info = paginate(all_specialists, page, per_page)
+
     return {
         "articles": articles_page,
         "specialists": specialists_page,
         "pagination": {
             "current_page": page,
             "per_page": per_page,
-            "articles": {
-                "total": articles_total,
-                "total_pages": articles_total_pages,
-                "has_next": page < articles_total_pages,
-                "has_prev": page > 1
-            },
-            "specialists": {
-                "total": specialists_total,
-                "total_pages": specialists_total_pages,
-                "has_next": page < specialists_total_pages,
-                "has_prev": page > 1
-            }
+            "articles": articles_info,
+            "specialists": specialists_info,
         }
     }, 200
 
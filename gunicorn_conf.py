@@ -0,0 +1,21 @@
+"""Gunicorn settings for running OLASIS 4.0 in production.
+
+Usage: ``gunicorn -c gunicorn_conf.py app:app``
+
+Requests spend most of their time waiting on Gemini, OpenAlex and ORCID, so
+each worker runs a pool of threads (``gthread``) instead of blocking a whole
+process per request.  The worker count defaults to one because the search,
+stats and chat caches — and OLABOT's conversation history — live in process
+memory; raise ``WEB_CONCURRENCY`` only when that trade-off is acceptable.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+# Gemini answers can take a while; keep the ceiling above the slowest replies.
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+keepalive = 5
+accesslog = "-"
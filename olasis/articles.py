@@ -17,12 +17,44 @@ objects suitable for presentation in the Streamlit app.
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
 
+from .cache import TTLCache
+from .ratelimit import TokenBucket
 from .utils import http_get, extract_authors
 
 OPENALEX_BASE_URL = 'https://api.openalex.org/works'
 
+#: Top-level work fields read by :func:`_project_result`.  Asking OpenAlex
+#: for only these drops abstracts, concepts and references from the payload.
+SELECT_FIELDS = ','.join((
+    'id', 'doi', 'display_name', 'publication_year', 'authorships',
+    'primary_location', 'best_oa_location',
+))
+
+#: Upper bound on simultaneous OpenAlex requests from one batch call.
+MAX_CONCURRENT_REQUESTS = 10
+
+#: Largest page OpenAlex serves, and how many pages are fetched at once.
+MAX_PER_PAGE = 200
+MAX_CONCURRENT_PAGES = 5
+
+#: Basic (non-cursor) paging stops at this many results.
+MAX_PAGED_RESULTS = 10_000
+
+#: OpenAlex allows at most 50 OR-ed values in a single filter.
+MAX_IDS_PER_REQUEST = 50
+
+# OpenAlex's polite pool allows 10 requests per second; bursts above that are
+# answered with 429, so calls are spaced here instead.
+_OPENALEX_BUCKET = TokenBucket(rate=10)
+
+# Repeated searches (Streamlit reruns, paging, several front-ends) are served
+# from memory for a few minutes instead of spending OpenAlex quota again.
+_ARTICLE_CACHE = TTLCache(maxsize=512, ttl=300)
+
 
 def search_articles(query: str, *, per_page: int = 5, mailto: Optional[str] = None) -> List[Dict[str, Any]]:
     """Search OpenAlex for works matching a query.
@@ -50,44 +82,199 @@ def search_articles(query: str, *, per_page: int = 5, mailto: Optional[str] = No
         will be returned.
     """
     per_page = max(1, min(per_page, 200))
-    email = mailto or os.getenv('OPENALEX_MAILTO')
+    email = mailto or _default_mailto()
+    # Case is kept: OpenAlex only treats upper-case AND/OR/NOT as operators.
+    cache_key = (query.strip(), per_page, email)
+    cached = _ARTICLE_CACHE.get(cache_key)
+    if cached is not None:
+        return [_copy_article(article) for article in cached]
+
     params: Dict[str, Any] = {
-        'search': query,
+        'search': cache_key[0],
         'per_page': per_page,
+        'select': SELECT_FIELDS,
     }
     if email:
         params['mailto'] = email
 
+    _OPENALEX_BUCKET.acquire()
     data = http_get(OPENALEX_BASE_URL, params=params)
     if not data or 'results' not in data:
         return []
 
-    articles: List[Dict[str, Any]] = []
-    for result in data.get('results', []):
-        # Each result is an OpenAlex work object.  See the documentation for
-        # complete structure.
-        title = result.get('display_name') or result.get('title') or 'Untitled'
-        authorships = result.get('authorships') or []
-        authors = extract_authors(authorships)
-        publication_year = result.get('publication_year') or result.get('from_year')
-        openalex_id = result.get('id')
-        doi = result.get('doi')
-        
-        # Extract article URL from primary_location
-        primary_location = result.get('primary_location') or {}
-        article_url = primary_location.get('landing_page_url')
-        
-        # If no direct URL, try to get from best_oa_location
-        if not article_url:
-            best_oa_location = result.get('best_oa_location') or {}
-            article_url = best_oa_location.get('landing_page_url')
-        
-        articles.append({
-            'title': title,
-            'authors': authors,
-            'year': publication_year,
-            'openalex_id': openalex_id,
-            'doi': doi,
-            'url': article_url,
-        })
+    articles = [_project_result(result) for result in data.get('results', [])]
+    if articles:
+        _ARTICLE_CACHE.set(cache_key, tuple(_copy_article(article) for article in articles))
     return articles
+
+
+def _copy_article(article: Dict[str, Any]) -> Dict[str, Any]:
+    # Callers get their own dicts, so edits to a result never reach the cache.
+    return {**article, 'authors': list(article['authors'])}
+
+
+@lru_cache(maxsize=1)
+def _default_mailto() -> Optional[str]:
+    # Read once, on first use rather than at import: the apps import this
+    # module before load_dotenv() has filled in the environment.
+    return os.getenv('OPENALEX_MAILTO') or None
+
+
+def clear_article_cache() -> None:
+    """Forget every memoised :func:`search_articles` result."""
+    _ARTICLE_CACHE.clear()
+
+
+def search_articles_many(queries: Iterable[str], *, per_page: int = 5,
+                         mailto: Optional[str] = None) -> List[List[Dict[str, Any]]]:
+    """Run several :func:`search_articles` queries concurrently.
+
+    The lookups are independent and bound by network latency, so they are
+    fanned out over a small thread pool sharing the pooled HTTP session.
+    At most :data:`MAX_CONCURRENT_REQUESTS` run at once, in line with
+    OpenAlex's polite-pool limit.
+
+    Returns
+    -------
+    list of list of dict
+        One result list per query, in the order the queries were given.
+    """
+    queries = list(queries)
+    if not queries:
+        return []
+
+    workers = min(MAX_CONCURRENT_REQUESTS, len(queries))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="olasis-openalex") as pool:
+        return list(pool.map(
+            lambda query: search_articles(query, per_page=per_page, mailto=mailto),
+            queries,
+        ))
+
+
+def search_articles_paginated(query: str, *, total: int = 500,
+                              mailto: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Search OpenAlex for up to ``total`` works, fetching pages in parallel.
+
+    :func:`search_articles` is limited to one page of at most
+    :data:`MAX_PER_PAGE` results.  This issues every page request needed
+    for ``total`` side by side, at most :data:`MAX_CONCURRENT_PAGES` at a
+    time and still subject to the OpenAlex rate limit, then stitches the
+    pages together in order.
+
+    Parameters
+    ----------
+    query: str
+        The search string, as in :func:`search_articles`.
+    total: int
+        Number of results wanted (at most :data:`MAX_PAGED_RESULTS`).
+    mailto: str | None
+        Optional contact email, as in :func:`search_articles`.
+
+    Returns
+    -------
+    list of dict
+        Up to ``total`` projected works, de-duplicated by ``openalex_id``.
+        Pages that fail are skipped.
+    """
+    total = max(1, min(total, MAX_PAGED_RESULTS))
+    per_page = min(total, MAX_PER_PAGE)
+    pages = -(-total // per_page)
+    email = mailto or _default_mailto()
+
+    base: Dict[str, Any] = {
+        'search': query.strip(),
+        'per_page': per_page,
+        'select': SELECT_FIELDS,
+    }
+    if email:
+        base['mailto'] = email
+
+    def _fetch_page(page: int) -> List[Dict[str, Any]]:
+        _OPENALEX_BUCKET.acquire()
+        data = http_get(OPENALEX_BASE_URL, params={**base, 'page': page})
+        return (data or {}).get('results', [])
+
+    workers = min(MAX_CONCURRENT_PAGES, pages)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="olasis-openalex") as pool:
+        page_results = list(pool.map(_fetch_page, range(1, pages + 1)))
+
+    # Results can shift between pages while they are fetched; keep the first copy.
+    articles: Dict[Any, Dict[str, Any]] = {}
+    for results in page_results:
+        for result in results:
+            article = _project_result(result)
+            articles.setdefault(article['openalex_id'] or id(result), article)
+    return list(articles.values())[:total]
+
+
+def get_works_by_ids(ids: Iterable[str], *, mailto: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Fetch known OpenAlex works in batches instead of one request per ID.
+
+    OpenAlex accepts up to :data:`MAX_IDS_PER_REQUEST` values OR-ed together
+    in a single ``openalex`` filter, so fifty IDs cost one round trip.
+
+    Parameters
+    ----------
+    ids: iterable of str
+        OpenAlex work IDs, either short (``W2741809807``) or as full
+        ``https://openalex.org/...`` URLs.
+    mailto: str | None
+        Optional contact email, as in :func:`search_articles`.
+
+    Returns
+    -------
+    list of dict
+        The projected works, in the order of ``ids``.  IDs that OpenAlex
+        does not return (or requests that fail) are skipped.
+    """
+    short_ids = list(dict.fromkeys(_short_openalex_id(work_id) for work_id in ids if work_id))
+    email = mailto or _default_mailto()
+
+    found: Dict[str, Dict[str, Any]] = {}
+    for start in range(0, len(short_ids), MAX_IDS_PER_REQUEST):
+        chunk = short_ids[start:start + MAX_IDS_PER_REQUEST]
+        params: Dict[str, Any] = {
+            'filter': 'openalex:' + '|'.join(chunk),
+            'per_page': len(chunk),
+            'select': SELECT_FIELDS,
+        }
+        if email:
+            params['mailto'] = email
+
+        _OPENALEX_BUCKET.acquire()
+        data = http_get(OPENALEX_BASE_URL, params=params)
+        for result in (data or {}).get('results', []):
+            article = _project_result(result)
+            found[_short_openalex_id(article['openalex_id'] or '')] = article
+
+    return [found[work_id] for work_id in short_ids if work_id in found]
+
+
+def _short_openalex_id(work_id: str) -> str:
+    return work_id.rstrip('/').rsplit('/', 1)[-1]
+
+
+def _project_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce an OpenAlex work object to the fields shown in the UI."""
+    title = result.get('display_name') or result.get('title') or 'Untitled'
+    authorships = result.get('authorships') or []
+    authors = extract_authors(authorships)
+    publication_year = result.get('publication_year') or result.get('from_year')
+
+    # Extract article URL from primary_location
+    primary_location = result.get('primary_location') or {}
+    article_url = primary_location.get('landing_page_url')
+
+    # If no direct URL, try to get from best_oa_location
+    if not article_url:
+        best_oa_location = result.get('best_oa_location') or {}
+        article_url = best_oa_location.get('landing_page_url')
+
+    return {
+        'title': title,
+        'authors': authors,
+        'year': publication_year,
+        'openalex_id': result.get('id'),
+        'doi': result.get('doi'),
+        'url': article_url,
+    }
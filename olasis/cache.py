@@ -0,0 +1,161 @@
+"""In-process caching helpers for OLASIS 4.0.
+
+The upstream services used by the application (OpenAlex, ORCID and the
+Gemini API) are slow compared to a dictionary lookup and their answers
+change slowly.  :class:`TTLCache` keeps recent results in memory for a
+bounded amount of time so repeated requests can skip the network round
+trip entirely.  It is intentionally tiny and dependency free.
+
+:class:`SemanticCache` complements it for free-text questions, matching
+paraphrases by the cosine similarity of their embeddings.
+"""
+from __future__ import annotations
+
+import math
+import operator
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Hashable, Optional, Sequence, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries expire after ``ttl`` seconds.
+
+    Parameters
+    ----------
+    maxsize: int
+        Maximum number of entries kept.  When full, the least recently used
+        entry is evicted.
+    ttl: float
+        Lifetime of an entry in seconds, measured from when it was stored.
+    timer: callable
+        Monotonic clock used to timestamp entries.  Mostly useful for tests.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: float = 300.0,
+        *,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` or ``default`` if absent/expired."""
+
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at <= self._timer():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entry if full."""
+
+        with self._lock:
+            self._data[key] = (self._timer() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove ``key`` and return its value (expired or not)."""
+
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        return entry[1]
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class SemanticCache:
+    """Thread-safe store answering lookups by embedding similarity.
+
+    Vectors are L2-normalised on insert, so the cosine similarity of a
+    lookup is a plain dot product.  Entries are partitioned by
+    ``namespace`` and evicted oldest first once ``maxsize`` is reached.
+
+    Parameters
+    ----------
+    maxsize: int
+        Maximum number of entries kept across all namespaces.
+    threshold: float
+        Minimum cosine similarity for a stored value to be returned.
+    """
+
+    def __init__(self, maxsize: int = 256, threshold: float = 0.92) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self._entries: deque[Tuple[Hashable, Tuple[float, ...], Any]] = deque(maxlen=maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, namespace: Hashable, vector: Sequence[float], default: Any = None) -> Any:
+        """Return the value most similar to ``vector``, or ``default``."""
+
+        unit = _normalise(vector)
+        if unit is None:
+            return default
+        with self._lock:
+            entries = [entry for entry in self._entries if entry[0] == namespace]
+        best_score, best_value = self.threshold, default
+        for _, stored, value in entries:
+            score = sum(map(operator.mul, stored, unit))
+            if score >= best_score:
+                best_score, best_value = score, value
+        return best_value
+
+    def set(self, namespace: Hashable, vector: Sequence[float], value: Any) -> None:
+        """Store ``value`` under ``vector`` within ``namespace``."""
+
+        unit = _normalise(vector)
+        if unit is None:
+            return
+        with self._lock:
+            self._entries.append((namespace, unit, value))
+
+    def clear(self) -> None:
+        """Drop every stored entry."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def _normalise(vector: Sequence[float]) -> Optional[Tuple[float, ...]]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    if not norm:
+        return None
+    return tuple(x / norm for x in vector)
@@ -10,23 +10,284 @@ Versão otimizada:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
 import re
-from typing import Dict, List, Optional, Tuple
+import threading
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-try:
-    from google import genai  # type: ignore
-except Exception:
-    genai = None
-
-try:
-    from langdetect import detect  # type: ignore
-except Exception:
-    detect = None
+from .cache import SemanticCache, TTLCache
+from .dependencies import optional_genai, optional_langdetect, optional_orjson
 
 logger = logging.getLogger(__name__)
 
+orjson = optional_orjson()
+
+# Últimas 5 interações (usuário + assistente) mantidas como contexto.
+_MAX_LOG_MESSAGES = 10
+
+# Códigos de idioma aceitos (como o front-end os envia) -> idioma suportado.
+_LANG_NORMALIZE = {
+    "en": "en", "EN": "en", "en-us": "en", "en-US": "en", "en-gb": "en", "en-GB": "en",
+    "es": "es", "ES": "es", "es-es": "es", "es-ES": "es",
+    "pt": "pt", "PT": "pt", "pt-br": "pt", "pt-BR": "pt", "pt-pt": "pt", "pt-PT": "pt",
+}
+
+# Letras que só um dos idiomas usa: decidem sem precisar do langdetect. Uma
+# só não basta ("São Paulo" numa pergunta em espanhol), por isso exigem-se
+# _MIN_LANGUAGE_SIGNALS ocorrências de um idioma e nenhuma do outro.
+_PT_ONLY_CHARS = re.compile(r"[ãõçâêô]", re.IGNORECASE)
+_ES_ONLY_CHARS = re.compile(r"[ñ¿¡]", re.IGNORECASE)
+_MIN_LANGUAGE_SIGNALS = 2
+
+# Caracteres da pergunta usados na detecção de idioma (e na chave do seu cache).
+_DETECT_CHARS = 200
+
+# Perguntas guardadas para get_session_stats; o total é contado à parte.
+_MAX_QUESTION_HISTORY = 200
+
+# Caracteres acumulados antes de aplicar as regras de saudação num stream.
+_STREAM_HEAD_CHARS = 160
+
+# Respostas por prompt exato; o prompt inclui idioma, modo intro e histórico.
+_REPLY_CACHE_SIZE = 4096
+_REPLY_CACHE_TTL = 3600
+_REPLY_CACHE_MAX_TEMPERATURE = 0.8
+
+# Cache semântico (opcional): perguntas parafraseadas no início de uma conversa.
+_SEMANTIC_CACHE_SIZE = 256
+_EMBEDDING_MODEL = "gemini-embedding-001"
+
+# Turnos gravados no checkpoint antes de reescrevê-lo só com a janela retida.
+_CHECKPOINT_COMPACT_TURNS = 50
+
+# Chamadas simultâneas ao Gemini em ask_many (limite de RPM da API).
+_MAX_CONCURRENT_ASKS = 10
+
+_UNAVAILABLE_MESSAGES = {
+    "en": (
+        "[Chatbot not available. Set GOOGLE_API_KEY in a local .env file]"
+        "\n1. Run: cp .env.example .env"
+        "\n2. Open .env and replace GOOGLE_API_KEY=sua_chave_api_aqui with your real key"
+        "\n3. Restart the server or export the variable before running Flask"
+        "\nNeed help? Execute: python -m olasis.setup_checks"
+    ),
+    "pt": (
+        "[Chatbot indisponível. Defina GOOGLE_API_KEY em um arquivo .env local]"
+        "\n1. Rode: cp .env.example .env"
+        "\n2. Abra o .env e substitua GOOGLE_API_KEY=sua_chave_api_aqui pela sua chave real"
+        "\n3. Reinicie o servidor ou exporte a variável antes de iniciar o Flask"
+        "\nPara ajuda, execute: python -m olasis.setup_checks"
+    ),
+    "es": (
+        "[Chatbot no disponible. Define GOOGLE_API_KEY en un archivo .env local]"
+        "\n1. Ejecuta: cp .env.example .env"
+        "\n2. Abre .env y reemplaza GOOGLE_API_KEY=sua_chave_api_aqui con tu clave real"
+        "\n3. Reinicia el servidor o exporta la variable antes de iniciar Flask"
+        "\n¿Dudas? Ejecuta: python -m olasis.setup_checks"
+    ),
+}
+
+_API_ERROR_MESSAGES = {
+    "en": "[Sorry, I couldn't generate a response due to an API error.]",
+    "es": "[Lo siento, no pude generar una respuesta debido a un error en la API.]",
+    "pt": "[Desculpe, não consegui gerar uma resposta por causa de um erro na API.]",
+}
+
+
+# Regras de sistema: intro curta só na primeira resposta, depois respostas moderadas.
+_INTRO_PROMPTS = {
+    "en": (
+        "You are OLABOT, a research assistant for OLASIS 4.0. "
+        "In the first response, begin exactly with the sentence 'Hello! How are you?'. "
+        "Right after that sentence, answer the user's question succinctly and avoid repeating extra greetings. Respond in English."
+    ),
+    "es": (
+        "Eres OLABOT, asistente especializado en investigación científica del OLASIS 4.0. "
+        "En la primera respuesta, comienza exactamente con la frase '¡Hola! ¿Cómo estás?'. "
+        "Justo después de esa frase, responde a la pregunta del usuario sin repetir saludos adicionales. Responde en español."
+    ),
+    "pt": (
+        "Você é o OLABOT, assistente especializado em pesquisa científica do OLASIS 4.0. "
+        "Na primeira resposta, comece exatamente com a frase 'Olá! Como vai?'. "
+        "Logo após essa frase, responda à pergunta do usuário de forma objetiva, sem repetir saudações adicionais. Responda em português."
+    ),
+}
+
+_FOLLOW_PROMPTS = {
+    "en": (
+        "You are OLABOT, a research assistant for OLASIS 4.0. "
+        "Answer the user's question directly in a clear, detailed way, but limit the answer to 2 to 4 paragraphs. "
+        "Provide scientific context or best practices in external oversight when relevant, avoid overly long responses, and do not begin with greetings—go straight to the content. Respond in English."
+    ),
+    "es": (
+        "Eres OLABOT, asistente especializado en investigación científica del OLASIS 4.0. "
+        "Responde directamente a la pregunta del usuario de forma clara y detallada, "
+        "pero limita la respuesta a 2 a 4 párrafos como máximo. Proporciona contexto científico o buenas prácticas en control externo cuando sea pertinente, evita respuestas demasiado largas y no comiences con saludos; ve directo al contenido. Responde en español."
+    ),
+    "pt": (
+        "Você é o OLABOT, assistente especializado em pesquisa científica do OLASIS 4.0. "
+        "Responda diretamente à pergunta do usuário de forma clara, detalhada e embasada, "
+        "mas limite a resposta a 2 a 4 parágrafos no máximo. Forneça contexto científico ou boas práticas em controle externo quando fizer sentido, evite respostas excessivamente longas e não inicie com saudações; vá direto ao conteúdo. Responda em português."
+    ),
+}
+
+_USER_LABELS = {"en": "User", "es": "Usuario", "pt": "Usuário"}
+_ASSISTANT_LABELS = {"en": "OLABOT", "es": "OLABOT", "pt": "OLABOT"}
+
+
+@dataclass(frozen=True, slots=True)
+class _LangConfig:
+    """Every fixed string the bot needs for one language."""
+
+    intro_prompt: str
+    follow_prompt: str
+    user_label: str
+    assistant_label: str
+    unavailable: str
+    api_error: str
+
+
+_LANG_CONFIG = {
+    lang: _LangConfig(
+        intro_prompt=_INTRO_PROMPTS[lang],
+        follow_prompt=_FOLLOW_PROMPTS[lang],
+        user_label=_USER_LABELS[lang],
+        assistant_label=_ASSISTANT_LABELS[lang],
+        unavailable=_UNAVAILABLE_MESSAGES[lang],
+        api_error=_API_ERROR_MESSAGES[lang],
+    )
+    for lang in ("en", "es", "pt")
+}
+
+
+def _lang_config(lang: str | None) -> _LangConfig:
+    return _LANG_CONFIG.get(lang) or _LANG_CONFIG["es"]
+
+
+# Saudações por idioma: intro padrão, intros antigas a remover e saudações iniciais.
+_GREETING_CONFIGS = {
+    "en": {
+        "intro": "Hello! How are you?",
+        "legacy_intros": [
+            "Hello! I am OLABOT, a research assistant for OLASIS 4.0.",
+            "Hello! I'm OLABOT, the virtual assistant for the OLASIS platform.",
+        ],
+        "pattern": re.compile(
+            r"^(?:(?:hello|hi|greetings|good\s+(?:morning|afternoon|evening|day))[!,.:\-]*\s+)+",
+            re.IGNORECASE,
+        ),
+    },
+    "es": {
+        "intro": "¡Hola! ¿Cómo estás?",
+        "legacy_intros": [
+            "¡Hola! Soy OLABOT, asistente de investigación para OLASIS 4.0.",
+            "¡Hola! Soy OLABOT, la asistente virtual de la plataforma OLASIS.",
+        ],
+        "pattern": re.compile(
+            r"^(?:(?:hola|buenos\s+d[ií]as|buenas\s+tardes|buenas\s+noches)[!,.:\-]*\s+)+",
+            re.IGNORECASE,
+        ),
+    },
+    "pt": {
+        "intro": "Olá! Como vai?",
+        "legacy_intros": [
+            "Olá! Eu sou o OLABOT, seu assistente especializado em pesquisa científica do OLASIS 4.0.",
+            "Olá! Sou a OLABOT, a assistente virtual da plataforma OLASIS.",
+        ],
+        "pattern": re.compile(
+            r"^(?:(?:olá|oi|saudações|bom\s+dia|boa\s+tarde|boa\s+noite)[!,.:\-]*\s+)+",
+            re.IGNORECASE,
+        ),
+    },
+}
+
+
+for _config in _GREETING_CONFIGS.values():
+    _config["legacy_pattern"] = re.compile(
+        "|".join(re.escape(intro) for intro in _config["legacy_intros"])
+    )
+del _config
+
+# Um cliente Gemini por chave de API, compartilhado por todas as instâncias.
+_GENAI_CLIENTS: Dict[str, object] = {}
+_GENAI_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_genai_client(api_key: str):
+    """Return the process-wide Gemini client for ``api_key``.
+
+    Each client owns its own HTTP connection pool, so bots sharing a key
+    share one client and keep its connections warm between calls.  The
+    lock makes sure concurrent first requests build only one client.
+    """
+    client = _GENAI_CLIENTS.get(api_key)
+    if client is None:
+        with _GENAI_CLIENTS_LOCK:
+            client = _GENAI_CLIENTS.get(api_key)
+            if client is None:
+                client = optional_genai().Client(api_key=api_key)
+                _GENAI_CLIENTS[api_key] = client
+    return client
+
+
+def _is_log_entry(entry) -> bool:
+    """Return whether a replayed checkpoint line looks like a log entry."""
+    return (
+        isinstance(entry, dict)
+        and entry.get("role") in ("user", "assistant")
+        and isinstance(entry.get("content"), str)
+        and isinstance(entry.get("lang", ""), str)
+    )
+
+
+def _encode_log_entries(entries: Iterable[dict]) -> bytes:
+    if orjson is not None:
+        return b"".join(orjson.dumps(entry) + b"\n" for entry in entries)
+    return "".join(
+        json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries
+    ).encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _load_detect():
+    """Import langdetect on first use rather than when this module loads."""
+    module = optional_langdetect()
+    return module.detect if module is not None else None
+
+
+@lru_cache(maxsize=1024)
+def _detect_language(text: str) -> str:
+    """Return ``"en"``, ``"es"`` or ``"pt"`` for ``text``, defaulting to Spanish.
+
+    Letters used by only one of Portuguese and Spanish settle most questions
+    with a regex scan; langdetect's n-gram scoring is the slow fallback.
+    """
+    pt_signals = len(_PT_ONLY_CHARS.findall(text))
+    es_signals = len(_ES_ONLY_CHARS.findall(text))
+    if pt_signals >= _MIN_LANGUAGE_SIGNALS and not es_signals:
+        return "pt"
+    if es_signals >= _MIN_LANGUAGE_SIGNALS and not pt_signals:
+        return "es"
+    detect = _load_detect()
+    if detect is None:
+        return "es"
+    try:
+        guess = detect(text)
+    except Exception:
+        return "es"
+    if guess.startswith("pt"):
+        return "pt"
+    if guess.startswith("en"):
+        return "en"
+    return "es"
+
 
 class Chatbot:
     """Chatbot com intro inicial e respostas moderadas."""
@@ -39,8 +300,11 @@ class Chatbot:
         top_p: float = 0.9,
         max_output_tokens: int = 2000,    # limite de tamanho moderado
         enable_prompt_engineering: bool = True,
+        semantic_cache_threshold: float | None = None,
+        embedding_model: str = _EMBEDDING_MODEL,
+        checkpoint_path: str | os.PathLike[str] | None = None,
     ) -> None:
-        self.api_key, resolved_from = self._resolve_api_key(api_key)
+        self.api_key, _ = self._resolve_api_key(api_key)
         self.model: str = model
         self.temperature = temperature
         self.top_p = top_p
@@ -48,30 +312,55 @@ class Chatbot:
         self.enable_prompt_engineering = enable_prompt_engineering
 
         self._client = None
-        self._history: List[str] = []
+        self._history: deque[str] = deque(maxlen=_MAX_QUESTION_HISTORY)
+        self._total_questions = 0
         # Armazenar pares de mensagens (usuário/assistente) para manter contexto
         # Estrutura: {"role": "user" | "assistant", "content": str, "lang": str}
-        self._conversation_log: List[Dict[str, str]] = []
+        self._conversation_log: deque[Dict[str, str]] = deque(maxlen=_MAX_LOG_MESSAGES)
         self._first_answer: bool = True  # <-- controla intro inicial
+        # Histórico já formatado para o prompt; refeito só quando o log muda.
+        self._history_text: str | None = None
+        # O bot é compartilhado entre threads (gunicorn gthread): protege o
+        # log, o histórico e o modo intro. Nenhuma chamada de rede ocorre
+        # com o lock, e ele nunca é mantido através de um await.
+        self._state_lock = threading.Lock()
+        self._reply_cache = TTLCache(maxsize=_REPLY_CACHE_SIZE, ttl=_REPLY_CACHE_TTL)
+        self._cache_hits = 0
+        # Desligado por padrão: cada pergunta nova custa uma chamada de embedding.
+        self.embedding_model = embedding_model
+        self._semantic_cache = (
+            SemanticCache(maxsize=_SEMANTIC_CACHE_SIZE, threshold=semantic_cache_threshold)
+            if semantic_cache_threshold is not None
+            else None
+        )
+        # Chamadas ao Gemini em andamento, por chave de cache (ver ask_async).
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Checkpoint opcional em JSONL: a conversa sobrevive a reinícios.
+        self._checkpoint_fd: int | None = None
+        self._checkpoint_path: str | None = None
+        self._checkpoint_turns = 0
+        if checkpoint_path is not None:
+            self._open_checkpoint(checkpoint_path)
 
-        if genai is None:
-            logger.warning("google-genai library is not installed; Chatbot will be disabled.")
-            return
         if not self.api_key:
             logger.warning("GOOGLE_API_KEY is not set; Chatbot will be disabled.")
             return
+        # Importado só aqui: o SDK é pesado e nem toda sessão usa o chatbot.
+        if optional_genai() is None:
+            logger.warning("google-genai library is not installed; Chatbot will be disabled.")
+            return
 
-        os.environ.setdefault("GOOGLE_API_KEY", self.api_key)
-        if resolved_from != "GEMINI_API_KEY":
-            os.environ.setdefault("GEMINI_API_KEY", self.api_key)
         try:
-            self._client = genai.Client(api_key=self.api_key)
+            self._client = _get_genai_client(self.api_key)
             logger.info("Chatbot otimizado — model=%s", self.model)
         except Exception as exc:
             logger.error("Failed to initialise Google GenAI client: %s", exc)
             self._client = None
 
-        self.model_info = {
+    @property
+    def model_info(self) -> dict:
+        """Current model settings; also the static part of :meth:`get_session_stats`."""
+        return {
             "model": self.model,
             "temperature": self.temperature,
             "top_p": self.top_p,
@@ -101,168 +390,515 @@ class Chatbot:
         reset: bool = False,
         **kwargs,
     ) -> str:
-        if reset:
-            self._first_answer = True
-            self._history.clear()
-            self._conversation_log.clear()
-
-        self._history.append(question)
-
-        lang = (lang or "").lower()
-        if lang not in ("en", "es", "pt"):
-            if detect is not None:
-                try:
-                    guess = detect(question)
-                    if guess.startswith("pt"):
-                        lang = "pt"
-                    elif guess.startswith("en"):
-                        lang = "en"
-                    else:
-                        lang = "es"
-                except Exception:
-                    lang = "es"
-            else:
-                lang = "es"
-        
+        lang = self._start_turn(question, lang, reset)
+
         if self._client is None:
-            unavailable = {
-                "en": (
-                    "[Chatbot not available. Set GOOGLE_API_KEY in a local .env file]"
-                    "\n1. Run: cp .env.example .env"
-                    "\n2. Open .env and replace GOOGLE_API_KEY=sua_chave_api_aqui with your real key"
-                    "\n3. Restart the server or export the variable before running Flask"
-                    "\nNeed help? Execute: python -m olasis.setup_checks"
-                ),
-                "pt": (
-                    "[Chatbot indisponível. Defina GOOGLE_API_KEY em um arquivo .env local]"
-                    "\n1. Rode: cp .env.example .env"
-                    "\n2. Abra o .env e substitua GOOGLE_API_KEY=sua_chave_api_aqui pela sua chave real"
-                    "\n3. Reinicie o servidor ou exporte a variável antes de iniciar o Flask"
-                    "\nPara ajuda, execute: python -m olasis.setup_checks"
-                ),
-                "es": (
-                    "[Chatbot no disponible. Define GOOGLE_API_KEY en un archivo .env local]"
-                    "\n1. Ejecuta: cp .env.example .env"
-                    "\n2. Abre .env y reemplaza GOOGLE_API_KEY=sua_chave_api_aqui con tu clave real"
-                    "\n3. Reinicia el servidor o exporta la variable antes de iniciar Flask"
-                    "\n¿Dudas? Ejecuta: python -m olasis.setup_checks"
-                ),
-            }
-            return unavailable.get(lang, unavailable["es"])
-            
+            return _lang_config(lang).unavailable
+
+        is_first_answer = self._claim_first_answer()
         try:
-            # Intro curta apenas na primeira resposta
-            intro_prompts = {
-                "en": (
-                    "You are OLABOT, a research assistant for OLASIS 4.0. "
-                    "In the first response, begin exactly with the sentence 'Hello! How are you?'. "
-                    "Right after that sentence, answer the user's question succinctly and avoid repeating extra greetings. Respond in English."
-                ),
-                "es": (
-                    "Eres OLABOT, asistente especializado en investigación científica del OLASIS 4.0. "
-                    "En la primera respuesta, comienza exactamente con la frase '¡Hola! ¿Cómo estás?'. "
-                    "Justo después de esa frase, responde a la pregunta del usuario sin repetir saludos adicionales. Responde en español."
-                ),
-                "pt": (
-                    "Você é o OLABOT, assistente especializado em pesquisa científica do OLASIS 4.0. "
-                    "Na primeira resposta, comece exatamente com a frase 'Olá! Como vai?'. "
-                    "Logo após essa frase, responda à pergunta do usuário de forma objetiva, sem repetir saudações adicionais. Responda em português."
-                ),
-            }
-
-            follow_prompts = {
-                "en": (
-                    "You are OLABOT, a research assistant for OLASIS 4.0. "
-                    "Answer the user's question directly in a clear, detailed way, but limit the answer to 2 to 4 paragraphs. "
-                    "Provide scientific context or best practices in external oversight when relevant, avoid overly long responses, and do not begin with greetings—go straight to the content. Respond in English."
-                ),
-                "es": (
-                    "Eres OLABOT, asistente especializado en investigación científica del OLASIS 4.0. "
-                    "Responde directamente a la pregunta del usuario de forma clara y detallada, "
-                    "pero limita la respuesta a 2 a 4 párrafos como máximo. Proporciona contexto científico o buenas prácticas en control externo cuando sea pertinente, evita respuestas demasiado largas y no comiences con saludos; ve directo al contenido. Responde en español."
-                ),
-                "pt": (
-                    "Você é o OLABOT, assistente especializado em pesquisa científica do OLASIS 4.0. "
-                    "Responda diretamente à pergunta do usuário de forma clara, detalhada e embasada, "
-                    "mas limite a resposta a 2 a 4 parágrafos no máximo. Forneça contexto científico ou boas práticas em controle externo quando fizer sentido, evite respostas excessivamente longas e não inicie com saudações; vá direto ao conteúdo. Responda em português."
-                ),
-            }
-
-            user_labels = {"en": "User", "es": "Usuario", "pt": "Usuário"}
-            assistant_labels = {"en": "OLABOT", "es": "OLABOT", "pt": "OLABOT"}
-
-            system_rules = (intro_prompts if self._first_answer else follow_prompts).get(
-                lang,
-                intro_prompts["es"] if self._first_answer else follow_prompts["es"],
+            fresh = not conversation_history and not self._conversation_log
+            system_rules, contents = self._build_prompt(
+                question, lang, is_first_answer, conversation_history
             )
-            user_label = user_labels.get(lang, "Usuario")
-
-            # Construir contexto da conversa (últimas 5 interações = 10 mensagens)
-            history_snippets: List[str] = []
-            max_messages = 10
-
-            if conversation_history:
-            # Histórico externo já vem formatado; usar últimas entradas
-                history_snippets.extend(conversation_history[-max_messages:])
-            else:
-                if self._conversation_log:
-                    for entry in self._conversation_log[-max_messages:]:
-                        entry_lang = (entry.get("lang") or lang) or "es"
-                        if entry.get("role") == "assistant":
-                            label = assistant_labels.get(entry_lang, assistant_labels["es"])
-                        else:
-                            label = user_labels.get(entry_lang, user_labels["es"])
-                        history_snippets.append(f"{label}: {entry.get('content', '')}")
-
-            if history_snippets:
-                history_text = "\n".join(history_snippets)
-                full_prompt = f"{system_rules}\n\n{history_text}\n{user_label}: {question}"
-            else:
-                full_prompt = f"{system_rules}\n\n{user_label}: {question}"
+            cache_key = self._reply_cache_key(system_rules, contents, question)
+            cached = self._cached_reply(cache_key)
+            if cached is not None:
+                self._record_turn(question, cached, lang)
+                return cached
+
+            similar, vector = self._semantic_lookup(question, system_rules, fresh)
+            if similar is not None:
+                self._remember_reply(cache_key, similar)
+                self._record_turn(question, similar, lang)
+                return similar
 
             resp = self._client.models.generate_content(
                 model=self.model,
-                contents=full_prompt,
-                config={
-                    "temperature": float(self.temperature),
-                    "top_p": float(self.top_p),
-                    "max_output_tokens": int(self.max_output_tokens),
-                },
+                contents=contents,
+                config=self._generation_config(system_rules),
             )
+            answer = self._finish_answer(question, lang, resp, cache_key, is_first_answer)
+            self._semantic_remember(vector, system_rules, answer)
+            return answer
 
-            answer_raw = getattr(resp, "text", str(resp))
-            processed = self._postprocess(answer_raw)
+        except Exception as exc:
+            logger.error("Gemini API call failed: %s", exc)
+            self._release_first_answer(is_first_answer)
+            return _lang_config(lang).api_error
 
-            was_first_answer = self._first_answer
-            processed = self._enforce_greeting_rules(processed, lang, was_first_answer)
+    async def ask_async(
+        self,
+        question: str,
+        lang: str | None = None,
+        conversation_history: Optional[List[str]] = None,
+        reset: bool = False,
+        **kwargs,
+    ) -> str:
+        """Async counterpart of :meth:`ask` using the Gemini ``aio`` client.
 
-            if self._first_answer:
-                self._first_answer = False
-                
-            # Atualizar histórico da conversa com a nova interação
-            self._conversation_log.append({
-                "role": "user",
-                "content": question,
-                "lang": lang,
-            })
-            self._conversation_log.append({
-                "role": "assistant",
-                "content": processed,
-                "lang": lang,
-            })
-            if len(self._conversation_log) > max_messages:
-                self._conversation_log = self._conversation_log[-max_messages:]
-
-            return processed
+        The prompt is built before the first ``await``, so concurrent calls
+        each see the conversation as it stood when they started.  Calls whose
+        prompt matches one already in flight wait for that request instead of
+        sending their own, so a burst of identical questions costs a single
+        Gemini call.
+        """
+
+        lang = self._start_turn(question, lang, reset)
+
+        if self._client is None:
+            return _lang_config(lang).unavailable
+
+        is_first_answer = self._claim_first_answer()
+        try:
+            system_rules, contents = self._build_prompt(
+                question, lang, is_first_answer, conversation_history
+            )
+            cache_key = self._reply_cache_key(system_rules, contents, question)
+            cached = self._cached_reply(cache_key)
+            if cached is not None:
+                self._record_turn(question, cached, lang)
+                return cached
+
+            pending = self._inflight.get(cache_key)
+            if pending is not None:
+                answer = await asyncio.shield(pending)
+                if answer is None:
+                    self._release_first_answer(is_first_answer)
+                    return _lang_config(lang).api_error
+                self._record_turn(question, answer, lang)
+                return answer
+
+            pending = asyncio.get_running_loop().create_future()
+            self._inflight[cache_key] = pending
+            answer = None
+            try:
+                resp = await self._client.aio.models.generate_content(
+                    model=self.model,
+                    contents=contents,
+                    config=self._generation_config(system_rules),
+                )
+                answer = self._finish_answer(question, lang, resp, cache_key, is_first_answer)
+                return answer
+            finally:
+                del self._inflight[cache_key]
+                pending.set_result(answer)
 
         except Exception as exc:
             logger.error("Gemini API call failed: %s", exc)
-            api_error = {
-                "en": "[Sorry, I couldn't generate a response due to an API error.]",
-                "es": "[Lo siento, no pude generar una respuesta debido a un error en la API.]",
-                "pt": "[Desculpe, não consegui gerar uma resposta por causa de um erro na API.]",
-            }
-            return api_error.get(lang, api_error["es"])
+            self._release_first_answer(is_first_answer)
+            return _lang_config(lang).api_error
+
+    async def ask_many(
+        self,
+        questions: Iterable[str],
+        lang: str | None = None,
+        max_concurrency: int = _MAX_CONCURRENT_ASKS,
+    ) -> List[str]:
+        """Answer several questions concurrently, returning answers in order.
+
+        At most ``max_concurrency`` Gemini calls are in flight at once to
+        stay within the API's rate limits.
+        """
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _ask(question: str) -> str:
+            async with semaphore:
+                return await self.ask_async(question, lang=lang)
+
+        return list(await asyncio.gather(*(_ask(question) for question in questions)))
+
+    def ask_stream(
+        self,
+        question: str,
+        lang: str | None = None,
+        conversation_history: Optional[List[str]] = None,
+        reset: bool = False,
+        **kwargs,
+    ) -> Iterator[str]:
+        """Yield the answer in fragments as Gemini generates it.
+
+        On the first answer the fixed greeting is yielded straight away,
+        before Gemini replies.  The model's first fragments are held back
+        until enough text has arrived to apply the greeting rules;
+        everything after that is passed through as soon as it is received.
+        The conversation log is updated once the stream finishes, exactly
+        as :meth:`ask` does.
+        """
+
+        lang = self._start_turn(question, lang, reset)
+
+        if self._client is None:
+            yield _lang_config(lang).unavailable
+            return
+
+        is_first_answer = self._claim_first_answer()
+        emitted: List[str] = []
+        intro = ""
+        completed = False
+        try:
+            fresh = not conversation_history and not self._conversation_log
+            system_rules, contents = self._build_prompt(
+                question, lang, is_first_answer, conversation_history
+            )
+            cache_key = self._reply_cache_key(system_rules, contents, question)
+            cached = self._cached_reply(cache_key)
+            if cached is not None:
+                self._record_turn(question, cached, lang)
+                completed = True
+                yield cached
+                return
+
+            similar, vector = self._semantic_lookup(question, system_rules, fresh)
+            if similar is not None:
+                self._remember_reply(cache_key, similar)
+                self._record_turn(question, similar, lang)
+                completed = True
+                yield similar
+                return
+
+            stream = self._client.models.generate_content_stream(
+                model=self.model,
+                contents=contents,
+                config=self._generation_config(system_rules),
+            )
+
+            # A primeira resposta sempre começa com a saudação fixa: envia já,
+            # sem esperar o modelo, e descarta-a do início processado.
+            intro = _GREETING_CONFIGS[lang]["intro"] if is_first_answer else ""
+            if intro:
+                emitted.append(intro)
+                yield intro
+
+            head_parts: List[str] = []
+            head_length = 0
+            head_sent = False
+            for chunk in stream:
+                text = getattr(chunk, "text", None)
+                if not text:
+                    continue
+                if head_sent:
+                    emitted.append(text)
+                    yield text
+                    continue
+
+                head_parts.append(text)
+                head_length += len(text)
+                if head_length >= _STREAM_HEAD_CHARS:
+                    head_sent = True
+                    head = self._finalise_stream_head(
+                        "".join(head_parts), lang, is_first_answer
+                    )[len(intro):]
+                    if head:
+                        emitted.append(head)
+                        yield head
+
+            if not head_sent:
+                head = self._finalise_stream_head(
+                    "".join(head_parts), lang, is_first_answer
+                )[len(intro):]
+                if head:
+                    emitted.append(head)
+                    yield head
+
+            answer = "".join(emitted).strip()
+            self._remember_reply(cache_key, answer)
+            self._semantic_remember(vector, system_rules, answer)
+            self._record_turn(question, answer, lang)
+            completed = True
+
+        except Exception as exc:
+            logger.error("Gemini streaming call failed: %s", exc)
+            if "".join(emitted) == intro:
+                api_error = _lang_config(lang).api_error
+                yield f" {api_error}" if intro else api_error
+        finally:
+            # Também cobre o GeneratorExit de um cliente SSE que desconecta.
+            if not completed:
+                self._release_first_answer(is_first_answer)
+
+    def _finish_answer(
+        self, question: str, lang: str, resp, cache_key: str, is_first_answer: bool
+    ) -> str:
+        """Post-process a Gemini response, then cache and record the turn."""
+
+        answer_raw = getattr(resp, "text", str(resp))
+        processed = self._postprocess(answer_raw)
+        processed = self._enforce_greeting_rules(processed, lang, is_first_answer)
+
+        self._remember_reply(cache_key, processed)
+        self._record_turn(question, processed, lang)
+        return processed
+
+    def _start_turn(self, question: str, lang: str | None, reset: bool) -> str:
+        """Apply ``reset``, register the question and resolve its language."""
+
+        with self._state_lock:
+            if reset:
+                self._first_answer = True
+                self._history.clear()
+                self._total_questions = 0
+                self._conversation_log.clear()
+                self._history_text = None
+                if self._checkpoint_fd is not None:
+                    os.ftruncate(self._checkpoint_fd, 0)
+                    self._checkpoint_turns = 0
+
+            self._history.append(question)
+            self._total_questions += 1
+
+        requested = lang
+        lang = _LANG_NORMALIZE.get(requested) if requested else None
+        if lang is None and requested:
+            lang = _LANG_NORMALIZE.get(requested.lower())
+        if lang is None:
+            lang = _detect_language(question[:_DETECT_CHARS])
+        return lang
+
+    def _claim_first_answer(self) -> bool:
+        """Take the first-answer slot for this turn, atomically.
+
+        Concurrent turns on a fresh conversation race for the intro; only
+        the one that claims the slot is answered with it, the others as
+        follow-ups, and each keeps its own flag for the whole turn.
+        """
+
+        with self._state_lock:
+            is_first_answer = self._first_answer
+            self._first_answer = False
+        return is_first_answer
+
+    def _release_first_answer(self, is_first_answer: bool) -> None:
+        # Se a primeira resposta falhar, a próxima pergunta volta a recebê-la.
+        if is_first_answer:
+            with self._state_lock:
+                if not self._conversation_log:
+                    self._first_answer = True
+
+    def _build_prompt(
+        self,
+        question: str,
+        lang: str,
+        is_first_answer: bool,
+        conversation_history: Optional[List[str]] = None,
+    ) -> Tuple[str, str]:
+        """Return the system rules and the conversation contents for a turn.
+
+        The rules are sent as Gemini's ``system_instruction`` so the stable
+        preamble is kept apart from the per-turn contents, which lets the API
+        reuse it across calls instead of re-reading it inside every prompt.
+        """
+
+        config = _lang_config(lang)
+        system_rules = config.intro_prompt if is_first_answer else config.follow_prompt
+        user_label = config.user_label
+
+        # Construir contexto da conversa (últimas 5 interações = 10 mensagens)
+        if conversation_history:
+            # Histórico externo já vem formatado; usar últimas entradas
+            history_text = "\n".join(conversation_history[-_MAX_LOG_MESSAGES:])
+        else:
+            history_text = self._log_history_text()
+
+        if history_text:
+            return system_rules, f"{history_text}\n{user_label}: {question}"
+        return system_rules, f"{user_label}: {question}"
+
+    def _log_history_text(self) -> str:
+        """Return the conversation log formatted for the prompt.
+
+        The text only changes when a turn is recorded, so it is built once
+        per turn and reused by every prompt until then.
+        """
+
+        with self._state_lock:
+            if self._history_text is None:
+                lines = []
+                for entry in self._conversation_log:
+                    config = _lang_config(entry.get("lang"))
+                    if entry.get("role") == "assistant":
+                        label = config.assistant_label
+                    else:
+                        label = config.user_label
+                    lines.append(f"{label}: {entry.get('content', '')}")
+                self._history_text = "\n".join(lines)
+            return self._history_text
+
+    def _cached_reply(self, cache_key: str) -> str | None:
+        if self.temperature > _REPLY_CACHE_MAX_TEMPERATURE:
+            return None
+        cached = self._reply_cache.get(cache_key)
+        if cached is not None:
+            self._cache_hits += 1
+        return cached
+
+    def _remember_reply(self, cache_key: str, answer: str) -> None:
+        # Em temperaturas altas a variação entre respostas é desejada.
+        if answer and self.temperature <= _REPLY_CACHE_MAX_TEMPERATURE:
+            self._reply_cache.set(cache_key, answer)
+
+    def _semantic_lookup(
+        self, question: str, system_rules: str, fresh: bool
+    ) -> Tuple[str | None, List[float] | None]:
+        """Embed ``question`` and return a cached answer to a paraphrase of it.
+
+        Only questions that open a conversation are matched: a follow-up's
+        meaning depends on the history, which the embedding does not see.
+        Returns ``(answer, vector)``; the vector is kept so the new answer
+        can be stored under it.
+        """
+
+        if (
+            self._semantic_cache is None
+            or not fresh
+            or self.temperature > _REPLY_CACHE_MAX_TEMPERATURE
+        ):
+            return None, None
+        try:
+            resp = self._client.models.embed_content(
+                model=self.embedding_model, contents=question
+            )
+            vector = list(resp.embeddings[0].values)
+        except Exception as exc:
+            logger.warning("Embedding failed; skipping the semantic cache: %s", exc)
+            return None, None
+
+        answer = self._semantic_cache.get(system_rules, vector)
+        if answer is not None:
+            self._cache_hits += 1
+        return answer, vector
+
+    def _semantic_remember(
+        self, vector: List[float] | None, system_rules: str, answer: str
+    ) -> None:
+        if vector is not None and answer:
+            self._semantic_cache.set(system_rules, vector, answer)
+
+    def _reply_cache_key(self, system_rules: str, contents: str, question: str) -> str:
+        """Key a reply by everything that shapes it: model, sampling and prompt.
+
+        ``contents`` ends with ``question``; that tail is keyed with case and
+        whitespace folded so "What is X?" and "what is  x?" share an answer.
+        The system rules already encode the language and intro mode, and the
+        rest of ``contents`` is the conversation history.
+        """
+
+        history = contents[:len(contents) - len(question)]
+        material = (
+            f"{self.model}\0{self.temperature}\0{self.top_p}\0{self.max_output_tokens}"
+            f"\0{system_rules}\0{history}\0{' '.join(question.split()).casefold()}"
+        )
+        return hashlib.blake2b(material.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _generation_config(self, system_rules: str) -> Dict[str, float | int | str]:
+        return {
+            "system_instruction": system_rules,
+            "temperature": float(self.temperature),
+            "top_p": float(self.top_p),
+            "max_output_tokens": int(self.max_output_tokens),
+        }
+
+    def _record_turn(self, question: str, answer: str, lang: str) -> None:
+        """Store a completed exchange and leave intro mode."""
+
+        with self._state_lock:
+            self._first_answer = False
+
+            # Atualizar histórico da conversa com a nova interação
+            self._history_text = None
+            entries = (
+                {"role": "user", "content": question, "lang": lang},
+                {"role": "assistant", "content": answer, "lang": lang},
+            )
+            self._conversation_log.extend(entries)
+            if self._checkpoint_fd is not None:
+                self._write_checkpoint(entries)
+
+    def _open_checkpoint(self, path: str | os.PathLike[str]) -> None:
+        """Replay a JSONL checkpoint into the log and keep it open for appends.
+
+        Lines that do not decode to a log entry (a write cut short by a
+        crash, hand edits) are skipped.  The file is then compacted to the
+        retained window, so it never carries more than the log can use.
+        """
+
+        loads = orjson.loads if orjson is not None else json.loads
+        try:
+            with open(path, "rb") as handle:
+                for line in handle:
+                    try:
+                        entry = loads(line)
+                    except ValueError:
+                        continue
+                    if _is_log_entry(entry):
+                        self._conversation_log.append(entry)
+        except FileNotFoundError:
+            pass
+        self._first_answer = not self._conversation_log
+        self._checkpoint_path = os.fspath(path)
+        self._compact_checkpoint()
+
+    def _write_checkpoint(self, entries) -> None:
+        # Uma única escrita por turno mantém pergunta e resposta juntas no arquivo.
+        try:
+            os.write(self._checkpoint_fd, _encode_log_entries(entries))
+        except OSError as exc:
+            logger.warning("Could not write the conversation checkpoint: %s", exc)
+            return
+        self._checkpoint_turns += 1
+        if self._checkpoint_turns >= _CHECKPOINT_COMPACT_TURNS:
+            self._compact_checkpoint()
+
+    def _compact_checkpoint(self) -> None:
+        """Rewrite the checkpoint to hold only the retained log entries.
+
+        The new file is written beside the old one and swapped in with
+        ``os.replace``, so a crash mid-rewrite leaves a complete file.
+        """
+
+        path = self._checkpoint_path
+        tmp_path = f"{path}.tmp"
+        # Fechado antes da troca: o Windows não substitui arquivos abertos.
+        if self._checkpoint_fd is not None:
+            os.close(self._checkpoint_fd)
+            self._checkpoint_fd = None
+        try:
+            with open(tmp_path, "wb") as handle:
+                handle.write(_encode_log_entries(self._conversation_log))
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Could not compact the conversation checkpoint: %s", exc)
+        try:
+            self._checkpoint_fd = os.open(
+                path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600
+            )
+        except OSError as exc:
+            # Sem arquivo, a conversa segue só em memória.
+            logger.warning("Could not reopen the conversation checkpoint: %s", exc)
+        self._checkpoint_turns = 0
+
+    def close(self) -> None:
+        """Close the conversation checkpoint, if one is open."""
+
+        with self._state_lock:
+            if self._checkpoint_fd is not None:
+                if self._checkpoint_turns:
+                    self._compact_checkpoint()
+            if self._checkpoint_fd is not None:
+                os.close(self._checkpoint_fd)
+                self._checkpoint_fd = None
+
+    def _finalise_stream_head(self, raw_head: str, lang: str, is_first_answer: bool) -> str:
+        """Apply the greeting rules to the buffered start of a streamed answer."""
+
+        processed = self._enforce_greeting_rules(
+            self._postprocess(raw_head), lang, is_first_answer
+        )
+        if not processed:
+            return ""
+        # Keep the separator between the head and the fragments that follow.
+        return processed + raw_head[len(raw_head.rstrip()):]
 
     # ------------------------------
     # Pós-processamento
@@ -273,56 +909,14 @@ class Chatbot:
     def _enforce_greeting_rules(self, text: str, lang: str, is_first_answer: bool) -> str:
         """Standardise greeting behaviour for the supported languages."""
 
-        greeting_configs = {
-            "en": {
-                "intro": "Hello! How are you?",
-                "legacy_intros": [
-                    "Hello! I am OLABOT, a research assistant for OLASIS 4.0.",
-                    "Hello! I'm OLABOT, the virtual assistant for the OLASIS platform.",
-                ],
-                "pattern": re.compile(
-                    r"^(?P<greeting>(hello|hi|greetings|good\s+(morning|afternoon|evening|day))[!,.:\-]*\s+)",
-                    re.IGNORECASE,
-                ),
-            },
-            "es": {
-                "intro": "¡Hola! ¿Cómo estás?",
-                "legacy_intros": [
-                    "¡Hola! Soy OLABOT, asistente de investigación para OLASIS 4.0.",
-                    "¡Hola! Soy OLABOT, la asistente virtual de la plataforma OLASIS.",
-                ],
-                "pattern": re.compile(
-                    r"^(?P<greeting>(hola|buenos\s+d[ií]as|buenas\s+tardes|buenas\s+noches)[!,.:\-]*\s+)",
-                    re.IGNORECASE,
-                ),
-            },
-            "pt": {
-                "intro": "Olá! Como vai?",
-                "legacy_intros": [
-                    "Olá! Eu sou o OLABOT, seu assistente especializado em pesquisa científica do OLASIS 4.0.",
-                    "Olá! Sou a OLABOT, a assistente virtual da plataforma OLASIS.",
-                ],
-                "pattern": re.compile(
-                    r"^(?P<greeting>(olá|oi|saudações|bom\s+dia|boa\s+tarde|boa\s+noite)[!,.:\-]*\s+)",
-                    re.IGNORECASE,
-                ),
-            },
-        }
-
         cleaned = text.strip()
-        config = greeting_configs.get(lang)
+        config = _GREETING_CONFIGS.get(lang)
 
         if not config:
             return cleaned
 
-        legacy_intros = config.get("legacy_intros", [])
-        for legacy_intro in legacy_intros:
-            if not legacy_intro:
-                continue
-            if cleaned.startswith(legacy_intro):
-                cleaned = cleaned[len(legacy_intro):].lstrip()
-            elif legacy_intro in cleaned:
-                cleaned = cleaned.replace(legacy_intro, " ").strip()
+        # Uma única varredura remove qualquer intro antiga, no início ou no meio.
+        cleaned = config["legacy_pattern"].sub(" ", cleaned).strip()
 
         intro = config["intro"]
         if is_first_answer:
@@ -340,18 +934,12 @@ class Chatbot:
             separator = " " if not cleaned.startswith(('.', ',', ';', ':', '!', '?')) else ""
             return f"{intro}{separator}{cleaned}".strip()
 
-        pattern = config["pattern"]
-        result = cleaned
-        while True:
-            match = pattern.match(result)
-            if not match:
-                break
-            result = result[match.end():].lstrip()
+        # O padrão casa toda a sequência de saudações iniciais de uma vez.
+        result = config["pattern"].sub("", cleaned, count=1)
 
         if result.startswith(intro):
             result = result[len(intro):].lstrip()
 
-
         return result or cleaned
 
     # ------------------------------
@@ -359,13 +947,11 @@ class Chatbot:
     # ------------------------------
     def get_session_stats(self) -> dict:
         return {
-            "total_questions": len(self._history),
+            "total_questions": self._total_questions,
             "last_question": self._history[-1] if self._history else None,
-            "model": self.model,
-            "temperature": self.temperature,
-            "top_p": self.top_p,
-            "max_output_tokens": self.max_output_tokens,
-            "prompt_engineering": self.enable_prompt_engineering,
+            **self.model_info,
+            "cache_hits": self._cache_hits,
+            "cache_size": len(self._reply_cache),
         }
     
     def _resolve_api_key(self, explicit_key: str | None) -> Tuple[str | None, str | None]:
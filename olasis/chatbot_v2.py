@@ -19,15 +19,19 @@ Referencias:
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import os
 import logging
 import time
-from typing import List, Dict, Optional
+from collections import deque
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 
-try:
-    from google import genai  # type: ignore
-except Exception:
-    genai = None  # fall back if google-genai is not installed
+from .cache import SemanticCache, TTLCache
+from .chatbot import _get_genai_client
+from .dependencies import optional_genai
 
 # Importar classes de engenharia de prompt
 try:
@@ -35,17 +39,70 @@ try:
         PromptBuilder, 
         ResponseOptimizer, 
         BEST_PRACTICES_CONFIG,
-        CONTENT_FILTERS
     )
 except ImportError:
     # Fallback para quando o módulo não estiver disponível
     PromptBuilder = None
     ResponseOptimizer = None
     BEST_PRACTICES_CONFIG = {}
-    CONTENT_FILTERS = {}
 
 logger = logging.getLogger(__name__)
 
+# Cache de respostas: perguntas repetidas não voltam ao Gemini.
+_RESPONSE_CACHE_SIZE = 1000
+_RESPONSE_CACHE_TTL = 24 * 3600
+
+# Cache semântico (opcional): paráfrases da pergunta que abre a conversa.
+_SEMANTIC_CACHE_SIZE = 256
+_EMBEDDING_MODEL = "gemini-embedding-001"
+
+# Persona fixa do modo simples, enviada como ``system_instruction``.
+_SIMPLE_SYSTEM_INSTRUCTION = """Você é OLABOT, assistente especializado em pesquisa científica do OLASIS 4.0.
+
+Responda de forma natural e conversacional, sem formatação markdown.
+Use texto plano e parágrafos bem estruturados.
+Foque em pesquisa científica e acadêmica."""
+
+# Chamadas simultâneas ao Gemini em ask_many (limite de RPM da API).
+_MAX_CONCURRENT_ASKS = 8
+
+# Histórico reenviado no prompt avançado: no máximo 6 turnos, cortados de 3
+# em 3 para que o início de ``contents`` mude raramente, e respostas
+# truncadas para limitar o custo de tokens.
+_PROMPT_HISTORY_MAX_TURNS = 6
+_PROMPT_HISTORY_DROP_TURNS = 3
+_PROMPT_HISTORY_REPLY_CHARS = 300
+
+_EMPTY_QUESTION_MESSAGE = "Por favor, faça uma pergunta específica sobre pesquisa científica."
+
+_FALLBACK_TMPL = """Olá! Sou o OLABOT, assistente especializado em pesquisa científica do OLASIS 4.0.
+
+Sua pergunta sobre "{question}" é muito interessante, mas no momento estou com limitações técnicas.
+
+Posso ajudar de outras formas:
+
+1. Use a ferramenta de busca avançada acima para encontrar artigos científicos relacionados ao seu tópico
+2. Explore nossa base de especialistas para encontrar pesquisadores da área
+3. Acesse links diretos para publicações e perfis acadêmicos
+
+O OLASIS integra as bases OpenAlex e ORCID, oferecendo acesso a milhões de artigos e pesquisadores globalmente.
+
+Gostaria que eu orientasse sobre termos de busca específicos para "{question}"?"""
+
+
+@lru_cache(maxsize=256)
+def _fallback(question: str) -> str:
+    return _FALLBACK_TMPL.format(question=question)
+
+
+def _normalize_prompt(question: str) -> str:
+    """Fold case and whitespace so trivial variants share a key.
+
+    Punctuation is kept: "C++", "C#" and "C" are different questions.
+    """
+
+    return " ".join(question.split()).casefold()
+
 
 class OlaBot:
     """
@@ -72,6 +129,9 @@ class OlaBot:
         Controle de criatividade (0.0 - 1.0, padrão: 0.7).
     enable_prompt_engineering: bool
         Ativar sistema avançado de engenharia de prompt (padrão: True).
+    semantic_cache_threshold: float | None
+        Similaridade mínima (cosseno) para reutilizar a resposta de uma
+        pergunta parecida. ``None`` (padrão) desliga o cache semântico.
     """
 
     def __init__(
@@ -79,7 +139,8 @@ class OlaBot:
         api_key: str | None = None, 
         model: str = 'gemini-2.5-flash',
         temperature: float = 0.7,
-        enable_prompt_engineering: bool = True
+        enable_prompt_engineering: bool = True,
+        semantic_cache_threshold: float | None = None,
     ) -> None:
         
         # Configuração básica
@@ -89,16 +150,33 @@ class OlaBot:
         self.model: str = model
         self.temperature: float = temperature
         self.enable_prompt_engineering: bool = enable_prompt_engineering
+        self._max_output_tokens: int = BEST_PRACTICES_CONFIG.get('max_response_length', 2000)
+        # Config de geração por system_instruction, reutilizada entre chamadas;
+        # _generation_config a remonta quando self.temperature muda.
+        self._gen_configs: Dict[str, Dict] = {}
         
         # Estado interno
         self._client = None
-        self._conversation_history: List[Dict[str, str]] = []
+        # Janela das últimas N interações; o deque descarta as antigas sozinho.
+        self._conversation_history: deque[Dict[str, str]] = deque(
+            maxlen=BEST_PRACTICES_CONFIG.get('max_history_length', 5)
+        )
+        # Turnos já no formato de ``contents`` (usuário, modelo, ...), ver _add_to_history.
+        self._prompt_turns: List[Dict] = []
         self._session_stats = {
             "total_queries": 0,
             "successful_responses": 0,
             "error_count": 0,
+            "cache_hits": 0,
             "session_start": time.time()
         }
+        self._response_cache = TTLCache(maxsize=_RESPONSE_CACHE_SIZE, ttl=_RESPONSE_CACHE_TTL)
+        # Desligado por padrão: cada pergunta nova custa uma chamada de embedding.
+        self._semantic_cache = (
+            SemanticCache(maxsize=_SEMANTIC_CACHE_SIZE, threshold=semantic_cache_threshold)
+            if semantic_cache_threshold is not None
+            else None
+        )
         
         # Inicializar componentes de engenharia de prompt
         if self.enable_prompt_engineering and PromptBuilder is not None:
@@ -111,18 +189,17 @@ class OlaBot:
                 logger.warning("Prompt engineering module not available, using basic mode")
 
         # Validação e inicialização
-        if genai is None:
-            logger.warning("google-genai library is not installed; OlaBot will be disabled.")
-            return
         if not self.api_key:
             logger.warning("GOOGLE_API_KEY is not set; OlaBot will be disabled.")
             return
+        if optional_genai() is None:
+            logger.warning("google-genai library is not installed; OlaBot will be disabled.")
+            return
             
-        # Configurar cliente Google Gemini
-        os.environ['GEMINI_API_KEY'] = self.api_key
+        # Cliente Gemini compartilhado por chave (mantém as conexões HTTP aquecidas)
         try:
-            self._client = genai.Client()
-            logger.info(f"OlaBot initialized successfully with model {self.model}")
+            self._client = _get_genai_client(self.api_key)
+            logger.info("OlaBot initialized successfully with model %s", self.model)
         except Exception as exc:
             logger.error("Failed to initialise Google GenAI client: %s", exc)
             self._client = None
@@ -153,59 +230,24 @@ class OlaBot:
         
         # Validar entrada
         if not question or not question.strip():
-            return "Por favor, faça uma pergunta específica sobre pesquisa científica."
+            return _EMPTY_QUESTION_MESSAGE
             
         # Verificar se o cliente está disponível
         if self._client is None:
             return self._get_fallback_response(question)
             
         try:
-            # Construir prompt contextualizado
-            if self.prompt_builder and context_type != "simple":
-                # Detectar contexto automaticamente se necessário
-                if context_type == "auto":
-                    context_type = self.prompt_builder.detect_context_type(question)
-                
-                # Construir prompt avançado
-                prompt = self.prompt_builder.build_contextual_prompt(
-                    user_message=question,
-                    context_type=context_type,
-                    conversation_history=self._get_recent_history()
-                )
-            else:
-                # Prompt simples para compatibilidade
-                prompt = self._build_simple_prompt(question)
-            
+            context_type, request, cache_key, cached = self._lookup(question, context_type)
+            vector = None
+            if cached is None:
+                cached, vector = self._semantic_lookup(question, context_type, request)
+            if cached is not None:
+                return self._serve_cached(question, context_type, cached)
+
             # Fazer chamada para a API
-            response = self._client.models.generate_content(
-                model=self.model,
-                contents=prompt,
-                config={
-                    'temperature': self.temperature,
-                    'max_output_tokens': BEST_PRACTICES_CONFIG.get('max_response_length', 2000)
-                }
-            )
-            
-            # Extrair texto da resposta
+            response = self._client.models.generate_content(**request)
             response_text = getattr(response, 'text', str(response))
-            
-            # Otimizar resposta se disponível
-            if self.response_optimizer:
-                response_text = self.response_optimizer.format_response(response_text)
-                response_text = self.response_optimizer.add_olasis_integration(response_text, question)
-                
-                # Validar qualidade
-                quality_check = self.response_optimizer.validate_response_quality(response_text)
-                if not quality_check.get("has_content", True):
-                    return self._get_fallback_response(question)
-            
-            # Salvar no histórico
-            self._add_to_history(question, response_text, context_type)
-            
-            # Atualizar estatísticas
-            self._session_stats["successful_responses"] += 1
-            
-            return response_text
+            return self._finish_answer(question, context_type, response_text, cache_key, vector)
             
         except Exception as exc:
             # Log do erro e atualização das estatísticas
@@ -213,32 +255,257 @@ class OlaBot:
             self._session_stats["error_count"] += 1
             
             return self._get_fallback_response(question)
-    
-    def _build_simple_prompt(self, question: str) -> str:
-        """Constrói um prompt simples para compatibilidade."""
-        return f"""Você é OLABOT, assistente especializado em pesquisa científica do OLASIS 4.0.
-        
-Responda de forma natural e conversacional, sem formatação markdown.
-Use texto plano e parágrafos bem estruturados.
-Foque em pesquisa científica e acadêmica.
 
-Pergunta: {question}"""
+    def ask_stream(self, question: str, context_type: str = "auto") -> Iterator[str]:
+        """Versão em streaming de :meth:`ask`: entrega o texto conforme chega.
+
+        A formatação do ``response_optimizer`` só pode ser aplicada ao texto
+        completo, então o histórico e o cache recebem a versão final, enquanto
+        o cliente vê os trechos crus do modelo.
+        """
+
+        self._session_stats["total_queries"] += 1
+        if not question or not question.strip():
+            yield _EMPTY_QUESTION_MESSAGE
+            return
+        if self._client is None:
+            yield self._get_fallback_response(question)
+            return
+
+        parts: List[str] = []
+        try:
+            context_type, request, cache_key, cached = self._lookup(question, context_type)
+            vector = None
+            if cached is None:
+                cached, vector = self._semantic_lookup(question, context_type, request)
+            if cached is not None:
+                yield self._serve_cached(question, context_type, cached)
+                return
+
+            stream = self._client.models.generate_content_stream(**request)
+            for chunk in stream:
+                text = getattr(chunk, 'text', None)
+                if text:
+                    parts.append(text)
+                    yield text
+            self._finish_answer(question, context_type, "".join(parts), cache_key, vector)
+
+        except Exception as exc:
+            logger.error("OlaBot API call failed: %s", exc)
+            self._session_stats["error_count"] += 1
+            if not parts:
+                yield self._get_fallback_response(question)
+
+    async def ask_async(self, question: str, context_type: str = "auto") -> str:
+        """Versão assíncrona de :meth:`ask` usando o cliente ``aio`` do Gemini.
+
+        O cache semântico não é consultado aqui: a chamada de embedding é
+        síncrona e bloquearia o event loop.
+        """
+
+        self._session_stats["total_queries"] += 1
+        if not question or not question.strip():
+            return _EMPTY_QUESTION_MESSAGE
+        if self._client is None:
+            return self._get_fallback_response(question)
+
+        try:
+            context_type, request, cache_key, cached = self._lookup(question, context_type)
+            if cached is not None:
+                return self._serve_cached(question, context_type, cached)
+
+            response = await self._client.aio.models.generate_content(**request)
+            response_text = getattr(response, 'text', str(response))
+            return self._finish_answer(question, context_type, response_text, cache_key, None)
+
+        except Exception as exc:
+            logger.error("OlaBot API call failed: %s", exc)
+            self._session_stats["error_count"] += 1
+            return self._get_fallback_response(question)
+
+    async def ask_many_async(
+        self,
+        questions: Iterable[str],
+        context_type: str = "auto",
+        concurrency: int = _MAX_CONCURRENT_ASKS,
+    ) -> List[str]:
+        """Responde várias perguntas em paralelo, mantendo a ordem de entrada.
+
+        No máximo ``concurrency`` chamadas ao Gemini ficam em andamento ao
+        mesmo tempo, para respeitar os limites da API.
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _ask(question: str) -> str:
+            async with semaphore:
+                return await self.ask_async(question, context_type)
+
+        return list(await asyncio.gather(*(_ask(q) for q in questions)))
+
+    def ask_many(
+        self,
+        questions: Iterable[str],
+        context_type: str = "auto",
+        concurrency: int = _MAX_CONCURRENT_ASKS,
+    ) -> List[str]:
+        """Wrapper síncrono de :meth:`ask_many_async` para scripts e avaliações."""
+
+        return asyncio.run(self.ask_many_async(questions, context_type, concurrency))
+
+    def _lookup(
+        self, question: str, context_type: str
+    ) -> Tuple[str, Dict, str, str | None]:
+        """Build the request for ``question`` and check the exact-match cache.
+
+        Returns the resolved context type, the ``generate_content`` keyword
+        arguments, the cache key and the cached answer (or ``None``).
+        """
+
+        # Detectar contexto automaticamente se necessário
+        if self.prompt_builder and context_type == "auto":
+            context_type = self.prompt_builder.detect_context_type(question)
+
+        request = self._generate_kwargs(question, context_type)
+        cache_key = self._response_cache_key(question, request)
+        return context_type, request, cache_key, self._response_cache.get(cache_key)
+
+    def _serve_cached(self, question: str, context_type: str, cached: str) -> str:
+        # Sem regravar no cache: a validade de 24 h conta desde a geração.
+        self._session_stats["cache_hits"] += 1
+        self._add_to_history(question, cached, context_type)
+        self._session_stats["successful_responses"] += 1
+        return cached
+
+    def _generate_kwargs(self, question: str, context_type: str) -> Dict:
+        system_instruction, contents = self._build_request(question, context_type)
+        return {
+            "model": self.model,
+            "contents": contents,
+            "config": self._generation_config(system_instruction),
+        }
+
+    def _generation_config(self, system_instruction: str) -> Dict:
+        config = self._gen_configs.get(system_instruction)
+        if config is None or config['temperature'] != self.temperature:
+            config = {
+                'system_instruction': system_instruction,
+                'temperature': self.temperature,
+                'max_output_tokens': self._max_output_tokens,
+            }
+            self._gen_configs[system_instruction] = config
+        return config
+
+    def _finish_answer(
+        self,
+        question: str,
+        context_type: str,
+        response_text: str,
+        cache_key: str,
+        vector: List[float] | None,
+    ) -> str:
+        """Post-process a Gemini response, then cache and record it."""
+
+        # Otimizar resposta se disponível
+        if self.response_optimizer:
+            response_text = self.response_optimizer.format_response(response_text)
+
+        # Resposta vazia não vai para o cache nem para o histórico
+        if not response_text.strip():
+            return self._get_fallback_response(question)
+        
+        # Salvar no cache e no histórico
+        self._response_cache.set(cache_key, response_text)
+        if vector is not None:
+            self._semantic_cache.set(self._semantic_namespace(context_type), vector, response_text)
+        self._add_to_history(question, response_text, context_type)
+        
+        # Atualizar estatísticas
+        self._session_stats["successful_responses"] += 1
+        
+        return response_text
     
-    def _get_fallback_response(self, question: str) -> str:
-        """Retorna uma resposta de fallback quando a API não está disponível."""
-        return f"""Olá! Sou o OLABOT, assistente especializado em pesquisa científica do OLASIS 4.0.
+    def _response_cache_key(self, question: str, request: Dict) -> str:
+        """Key a response by everything sent to Gemini for it.
 
-Sua pergunta sobre "{question}" é muito interessante, mas no momento estou com limitações técnicas.
+        The request's last part is the question itself; it is keyed with
+        case and whitespace folded so "What is X?" and "what is  x?" share
+        an answer.  Everything before it (history turns, per-turn context)
+        is keyed verbatim, as are the model and the generation config.
+        """
 
-Posso ajudar de outras formas:
+        contents = request["contents"]
+        material = json.dumps(
+            [
+                request["model"],
+                request["config"],
+                contents[:-1],
+                contents[-1]["parts"][:-1],
+                _normalize_prompt(question),
+            ],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
 
-1. Use a ferramenta de busca avançada acima para encontrar artigos científicos relacionados ao seu tópico
-2. Explore nossa base de especialistas para encontrar pesquisadores da área
-3. Acesse links diretos para publicações e perfis acadêmicos
+    def _semantic_lookup(
+        self, question: str, context_type: str, request: Dict
+    ) -> Tuple[str | None, List[float] | None]:
+        """Return a cached answer to a paraphrase of ``question`` and its embedding.
 
-O OLASIS integra as bases OpenAlex e ORCID, oferecendo acesso a milhões de artigos e pesquisadores globalmente.
+        Only questions asked without history are matched, since a follow-up
+        means little on its own.
+        """
 
-Gostaria que eu orientasse sobre termos de busca específicos para "{question}"?"""
+        # Mais de um turno em ``contents`` significa que há histórico.
+        if self._semantic_cache is None or len(request["contents"]) > 1:
+            return None, None
+        try:
+            resp = self._client.models.embed_content(model=_EMBEDDING_MODEL, contents=question)
+            vector = list(resp.embeddings[0].values)
+        except Exception as exc:
+            logger.warning("Embedding failed; skipping the semantic cache: %s", exc)
+            return None, None
+        return self._semantic_cache.get(self._semantic_namespace(context_type), vector), vector
+
+    def _semantic_namespace(self, context_type: str) -> Tuple[str, float, str]:
+        return (self.model, self.temperature, context_type)
+
+    def _build_request(self, question: str, context_type: str) -> Tuple[str, List[Dict]]:
+        """Split a turn into a static ``system_instruction`` and ``contents``.
+
+        The persona never changes, and the replayed history is trimmed in
+        blocks of turns rather than one turn at a time, so most consecutive
+        requests share a byte-identical prefix that Gemini may serve from
+        its prompt cache.  Per-turn context (date, final instructions) and
+        the question go last.
+        """
+
+        if self.prompt_builder and context_type != "simple":
+            dynamic_context = self.prompt_builder.build_contextual_prompt(
+                user_message=question,
+                context_type=context_type,
+                include_system_prompt=False,
+            )
+            contents = self._history_contents()
+            contents.append({
+                "role": "user",
+                "parts": [{"text": dynamic_context}, {"text": f"Pergunta: {question}"}],
+            })
+            return self.prompt_builder.templates.BASE_SYSTEM_PROMPT, contents
+
+        # Prompt simples para compatibilidade
+        return _SIMPLE_SYSTEM_INSTRUCTION, [
+            {"role": "user", "parts": [{"text": f"Pergunta: {question}"}]}
+        ]
+
+    def _history_contents(self) -> List[Dict]:
+        """Return the replayed turns as Gemini ``contents``, oldest first."""
+
+        return list(self._prompt_turns)
+    
+    def _get_fallback_response(self, question: str) -> str:
+        """Retorna uma resposta de fallback quando a API não está disponível."""
+        return _fallback(question)
     
     def _add_to_history(self, question: str, response: str, context_type: str) -> None:
         """Adiciona interação ao histórico da conversa."""
@@ -250,23 +517,13 @@ Gostaria que eu orientasse sobre termos de busca específicos para "{question}"?
         }
         
         self._conversation_history.append(interaction)
-        
-        # Manter apenas as últimas N interações
-        max_history = BEST_PRACTICES_CONFIG.get('max_history_length', 5)
-        if len(self._conversation_history) > max_history:
-            self._conversation_history = self._conversation_history[-max_history:]
-    
-    def _get_recent_history(self) -> List[str]:
-        """Retorna histórico recente formatado para contexto."""
-        if not self._conversation_history:
-            return []
-            
-        history_entries = []
-        for interaction in self._conversation_history[-3:]:  # Últimas 3 interações
-            entry = f"Q: {interaction['question']}\nR: {interaction['response'][:200]}..."
-            history_entries.append(entry)
-            
-        return history_entries
+
+        if len(response) > _PROMPT_HISTORY_REPLY_CHARS:
+            response = response[:_PROMPT_HISTORY_REPLY_CHARS] + "..."
+        self._prompt_turns.append({"role": "user", "parts": [{"text": question}]})
+        self._prompt_turns.append({"role": "model", "parts": [{"text": response}]})
+        if len(self._prompt_turns) > 2 * _PROMPT_HISTORY_MAX_TURNS:
+            del self._prompt_turns[:2 * _PROMPT_HISTORY_DROP_TURNS]
     
     def get_session_stats(self) -> Dict:
         """Retorna estatísticas da sessão atual."""
@@ -284,6 +541,7 @@ Gostaria que eu orientasse sobre termos de busca específicos para "{question}"?
     def clear_history(self) -> None:
         """Limpa o histórico da conversa."""
         self._conversation_history.clear()
+        self._prompt_turns.clear()
         logger.info("OlaBot conversation history cleared")
     
     def set_temperature(self, temperature: float) -> None:
@@ -297,14 +555,14 @@ Gostaria que eu orientasse sobre termos de busca específicos para "{question}"?
         """
         if 0.0 <= temperature <= 1.0:
             self.temperature = temperature
-            logger.info(f"OlaBot temperature set to {temperature}")
+            logger.info("OlaBot temperature set to %s", temperature)
         else:
-            logger.warning(f"Invalid temperature {temperature}, must be between 0.0 and 1.0")
+            logger.warning("Invalid temperature %s, must be between 0.0 and 1.0", temperature)
     
     @property
     def history(self) -> List[Dict[str, str]]:
         """Retorna o histórico completo da conversa."""
-        return self._conversation_history.copy()
+        return list(self._conversation_history)
     
     @property
     def is_available(self) -> bool:
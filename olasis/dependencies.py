@@ -17,11 +17,24 @@ from __future__ import annotations
 import importlib
 import importlib.util
 import sys
+from functools import lru_cache
 from pathlib import Path
 from types import ModuleType
 from typing import Callable
 
 
+@lru_cache(maxsize=None)
+def _probe(package: str) -> bool:
+    """Return whether ``package`` can be imported, probing ``sys.path`` once.
+
+    ``find_spec`` walks the import path and stats files on every call; the
+    answer does not change while the process runs.
+    """
+
+    return importlib.util.find_spec(package) is not None
+
+
+@lru_cache(maxsize=1)
 def _format_pip_command() -> str:
     """Return a shell-safe command string to install project requirements."""
 
@@ -50,8 +63,7 @@ def require_requests() -> ModuleType:
     but the message is significantly clearer for local setups.
     """
 
-    spec = importlib.util.find_spec("requests")
-    if spec is None:
+    if not _probe("requests"):
         raise _missing_dependency_error("requests")
 
     return importlib.import_module("requests")
@@ -60,8 +72,7 @@ def require_requests() -> ModuleType:
 def require_dotenv_loader() -> Callable[..., bool]:
     """Return :func:`dotenv.load_dotenv`, guiding installation if missing."""
 
-    spec = importlib.util.find_spec("dotenv")
-    if spec is None:
+    if not _probe("dotenv"):
         raise _missing_dependency_error("python-dotenv")
 
     module = importlib.import_module("dotenv")
@@ -78,8 +89,7 @@ def require_dotenv_loader() -> Callable[..., bool]:
 def require_flask() -> ModuleType:
     """Import and return the ``flask`` module with helpful guidance."""
 
-    spec = importlib.util.find_spec("flask")
-    if spec is None:
+    if not _probe("flask"):
         raise _missing_dependency_error("flask")
 
     module = importlib.import_module("flask")
@@ -93,3 +103,56 @@ def require_flask() -> ModuleType:
         )
 
     return module
+
+
+def optional_orjson() -> ModuleType | None:
+    """Return the ``orjson`` module when installed, otherwise ``None``.
+
+    ``orjson`` only speeds up JSON encoding and decoding, so callers are
+    expected to fall back to the standard library when it is missing.
+    """
+
+    if not _probe("orjson"):
+        return None
+
+    return importlib.import_module("orjson")
+
+
+def optional_flask_compress() -> ModuleType | None:
+    """Return the ``flask_compress`` module when installed, otherwise ``None``.
+
+    Response compression only saves bandwidth, so the application keeps
+    serving uncompressed responses when the package is missing.
+    """
+
+    if not _probe("flask_compress"):
+        return None
+
+    return importlib.import_module("flask_compress")
+
+
+def optional_genai() -> ModuleType | None:
+    """Return the ``google.genai`` module when installed, otherwise ``None``.
+
+    The SDK pulls in a large dependency graph, so the chatbot calls this
+    only when it is about to build a client rather than at import time.
+    """
+
+    if not _probe("google") or not _probe("google.genai"):
+        return None
+
+    return importlib.import_module("google.genai")
+
+
+def optional_langdetect() -> ModuleType | None:
+    """Return the ``langdetect`` module when installed, otherwise ``None``.
+
+    Only used to guess the language of chat questions that arrive without
+    one, so it is loaded on first use and the chatbot falls back to Spanish
+    when it is missing.
+    """
+
+    if not _probe("langdetect"):
+        return None
+
+    return importlib.import_module("langdetect")
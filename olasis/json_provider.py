@@ -0,0 +1,55 @@
+"""Fast JSON serialisation for the OLASIS Flask applications.
+
+Every API route returns JSON, so the encoder sits on the hot path of each
+response.  :class:`OrjsonProvider` swaps Flask's pure-Python ``json`` based
+provider for ``orjson`` when it is installed; :func:`install_json_provider`
+is a no-op otherwise so the apps keep working with the standard library.
+"""
+
+from __future__ import annotations
+
+from .dependencies import optional_orjson, require_flask
+
+flask = require_flask()
+orjson = optional_orjson()
+
+
+class OrjsonProvider(flask.json.provider.DefaultJSONProvider):
+    """JSON provider that encodes and decodes with ``orjson``.
+
+    Falls back to Flask's default hook for types orjson cannot handle and
+    keeps Flask's HTTP-date formatting for ``datetime`` values.
+    """
+
+    sort_keys = False
+
+    def _options(self, pretty: bool = False) -> int:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(
+            obj,
+            default=self.default,
+            option=self._options(pretty) | orjson.OPT_APPEND_NEWLINE,
+        )
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def install_json_provider(app) -> None:
+    """Use :class:`OrjsonProvider` for ``app`` when ``orjson`` is available."""
+
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
@@ -40,18 +40,53 @@ O OLASIS integra as bases OpenAlex e ORCID, oferecendo acesso a milhões de arti
 """
 
 
+# Palavras-chave por tipo de consulta, na ordem de prioridade da detecção.
+CONTEXT_KEYWORDS: Dict[str, List[str]] = {
+    "search": [
+        "buscar", "procurar", "encontrar", "pesquisar", "artigos", "estudos",
+        "publicações", "literatura", "bibliografia", "referências",
+    ],
+    "methodology": [
+        "metodologia", "método", "como fazer", "como pesquisar", "abordagem",
+        "procedimento", "técnica", "protocolo", "análise", "coleta de dados",
+    ],
+    "concept": [
+        "o que é", "o que significa", "definição", "conceito", "explique",
+        "significado", "definir", "entender",
+    ],
+}
+
+# Um padrão compilado por tipo: a busca das palavras roda no motor de regex,
+# em C.  Casa em qualquer ponto do texto ("protocolo" em "protocolos").
+_CONTEXT_PATTERNS = {
+    context: re.compile("|".join(map(re.escape, keywords)))
+    for context, keywords in CONTEXT_KEYWORDS.items()
+}
+
+
 class PromptBuilder:
     def __init__(self):
         self.templates = PromptTemplates()
 
+    def detect_context_type(self, user_message: str) -> str:
+        """Return the first context type whose keywords appear, else ``"general"``."""
+
+        message_lower = user_message.lower()
+        for context, pattern in _CONTEXT_PATTERNS.items():
+            if pattern.search(message_lower):
+                return context
+        return "general"
+
     def build_contextual_prompt(
         self,
         user_message: str,
         context_type: str = "general",
         conversation_history: Optional[List[str]] = None,
         user_profile: Optional[Dict] = None,
+        include_system_prompt: bool = True,
     ) -> str:
-        prompt_parts = [self.templates.BASE_SYSTEM_PROMPT]
+        # Sem o prompt de sistema, o chamador o envia à parte (system_instruction).
+        prompt_parts = [self.templates.BASE_SYSTEM_PROMPT] if include_system_prompt else []
 
         current_date = datetime.datetime.now().strftime("%d/%m/%Y")
         prompt_parts.append(f"\nDATA ATUAL: {current_date}")
@@ -0,0 +1,91 @@
+"""Combined article and specialist search with an in-process result cache.
+
+The web front-ends show six results per page but always fetch the first
+:data:`RESULT_LIMIT` matches from OpenAlex and ORCID so they can report
+totals and page counts.  :func:`search_all` memoises those full result lists
+per query, so paging through a query costs one upstream round trip instead
+of one per page.
+"""
+from __future__ import annotations
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+from .articles import search_articles
+from .cache import TTLCache
+from .specialists import search_specialists
+
+#: Number of articles and specialists fetched per query.
+RESULT_LIMIT = 50
+
+#: Results shown per page by the web front-ends.
+PER_PAGE = 6
+
+#: Highest page that can hold results, given :data:`RESULT_LIMIT`.
+MAX_PAGE = -(-RESULT_LIMIT // PER_PAGE)
+
+#: Shared pool for blocking upstream HTTP calls (OpenAlex, ORCID, ...).
+UPSTREAM_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="olasis-upstream")
+
+# Search results barely change within minutes.
+_RESULTS_CACHE = TTLCache(maxsize=1024, ttl=300)
+
+
+def normalise_query(query: str) -> str:
+    """Collapse whitespace so trivially different queries share a cache entry.
+
+    Case is preserved on purpose: ORCID's Lucene syntax treats ``AND``/``OR``
+    as operators only when upper-case.
+    """
+    return " ".join(query.split())
+
+
+def query_key(query: str) -> str:
+    """Return a short, fixed-size cache key for a normalised query."""
+    return hashlib.blake2b(query.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def search_all(query: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Return ``(articles, specialists)`` for ``query``, cached per query.
+
+    Both lookups run side by side on :data:`UPSTREAM_POOL`, so a cache miss
+    waits for the slower service rather than their sum.  Results where both
+    lists are empty usually mean an upstream failure and are not cached.
+    Callers get their own lists, so sorting or trimming them leaves the
+    cached entry intact.
+    """
+    key = query_key(query)
+    cached = _RESULTS_CACHE.get(key)
+    if cached is not None:
+        return list(cached[0]), list(cached[1])
+
+    articles_future = UPSTREAM_POOL.submit(search_articles, query, per_page=RESULT_LIMIT)
+    specialists_future = UPSTREAM_POOL.submit(search_specialists, query, rows=RESULT_LIMIT)
+    results = (articles_future.result(), specialists_future.result())
+
+    if results[0] or results[1]:
+        _RESULTS_CACHE.set(key, results)
+    return list(results[0]), list(results[1])
+
+
+def paginate(items: List[Any], page: int, per_page: int = PER_PAGE) -> Tuple[List[Any], Dict[str, Any]]:
+    """Return the slice of ``items`` for ``page`` and its pagination info.
+
+    ``page`` is 1-based.  Pages past the end yield an empty slice.
+    """
+    total = len(items)
+    total_pages = -(-total // per_page)
+    start = (page - 1) * per_page
+    page_items = items[start:start + per_page] if start < total else []
+    return page_items, {
+        "total": total,
+        "total_pages": total_pages,
+        "has_next": page < total_pages,
+        "has_prev": page > 1,
+    }
+
+
+def clear_cache() -> None:
+    """Drop every cached result list."""
+    _RESULTS_CACHE.clear()
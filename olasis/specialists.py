@@ -10,13 +10,20 @@ dictionaries suitable for display in the Streamlit UI.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from .utils import http_get
 
 ORCID_SEARCH_URL = 'https://pub.orcid.org/v3.0/search/'
 ORCID_RECORD_URL_TEMPLATE = 'https://pub.orcid.org/v3.0/{orcid}'
 
+# Record lookups per search, and a dedicated pool for them: callers may
+# already be running on the shared upstream pool, so nesting work there
+# could exhaust it.
+_MAX_RECORD_LOOKUPS = 10
+_RECORD_POOL = ThreadPoolExecutor(max_workers=_MAX_RECORD_LOOKUPS, thread_name_prefix="olasis-orcid")
+
 
 def search_specialists(query: str, *, rows: int = 5) -> List[Dict[str, Any]]:
     """Search for specialists in ORCID using a free‑text query.
@@ -51,56 +58,39 @@ def search_specialists(query: str, *, rows: int = 5) -> List[Dict[str, Any]]:
     if not data or 'result' not in data:
         return []
     
-    specialists: List[Dict[str, Any]] = []
+    # The search endpoint usually returns only identifiers, so names come from
+    # one record lookup per person.  Those lookups are independent; issue them
+    # concurrently instead of paying up to ten round trips back to back.
+    candidates = []
     for item in data.get('result', []):
-        # Each item contains only 'orcid-identifier', we need to fetch the full record
         orcid_identifier = item.get('orcid-identifier', {})
         path = orcid_identifier.get('path')
         uri = orcid_identifier.get('uri') or f'https://orcid.org/{path}' if path else None
-        
         if not path:
             continue
-            
-        # For performance, try to get names from the summary endpoint first (faster)
-        # Only fetch detailed record if we can't get basic info
-        given = None
-        family = None
-        full_name = None
-        
-        # Try to get basic info from the search result if available
-        if 'given-names' in item and item['given-names']:
-            given_names = item.get('given-names')
-            if given_names and 'value' in given_names:
-                given = given_names['value']
-                
-        if 'family-names' in item and item['family-names']:
-            family_names = item.get('family-names')
-            if family_names and 'value' in family_names:
-                family = family_names['value']
-        
-        # If we don't have names from search, fetch from record (but limit to avoid slowness)
-        if not given and not family and len(specialists) < 10:  # Only fetch details for first 10
-            record_url = ORCID_RECORD_URL_TEMPLATE.format(orcid=path)
-            record_data = http_get(record_url, headers=headers)
-            
-            if record_data and 'person' in record_data:
-                person = record_data['person']
-                if 'name' in person and person['name']:
-                    name_info = person['name']
-                    given_names = name_info.get('given-names')
-                    family_names = name_info.get('family-name')
-                    
-                    if given_names and 'value' in given_names:
-                        given = given_names['value']
-                    if family_names and 'value' in family_names:
-                        family = family_names['value']
-        
+        given, family = _names_from_search_item(item)
+        candidates.append((path, uri, given, family))
+
+    # Only fetch details for the first 10 results, to bound the extra calls.
+    to_fetch = [
+        path for index, (path, _, given, family) in enumerate(candidates)
+        if not given and not family and index < _MAX_RECORD_LOOKUPS
+    ]
+    records = dict(zip(to_fetch, _RECORD_POOL.map(
+        lambda path: _fetch_record_names(path, headers), to_fetch
+    )))
+
+    specialists: List[Dict[str, Any]] = []
+    for path, uri, given, family in candidates:
+        if path in records:
+            given, family = records[path]
+
         full_name = " ".join(filter(None, [given, family])) or None
-        
+
         # If we couldn't get names, use ORCID ID as fallback
         if not full_name:
             full_name = f"Pesquisador {path[-4:]}"  # Use last 4 digits of ORCID
-            
+
         specialists.append({
             'orcid': path,
             'given_names': given,
@@ -108,5 +98,39 @@ def search_specialists(query: str, *, rows: int = 5) -> List[Dict[str, Any]]:
             'full_name': full_name,
             'profile_url': uri,
         })
-    
+
     return specialists
+
+
+def _names_from_search_item(item: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    """Return the given and family names embedded in a search result, if any."""
+    given = None
+    family = None
+    given_names = item.get('given-names')
+    if given_names and 'value' in given_names:
+        given = given_names['value']
+    family_names = item.get('family-names')
+    if family_names and 'value' in family_names:
+        family = family_names['value']
+    return given, family
+
+
+def _fetch_record_names(path: str, headers: Dict[str, str]) -> Tuple[Optional[str], Optional[str]]:
+    """Fetch a full ORCID record and return its given and family names."""
+    record_url = ORCID_RECORD_URL_TEMPLATE.format(orcid=path)
+    record_data = http_get(record_url, headers=headers)
+
+    given = None
+    family = None
+    if record_data and 'person' in record_data:
+        person = record_data['person']
+        if 'name' in person and person['name']:
+            name_info = person['name']
+            given_names = name_info.get('given-names')
+            family_names = name_info.get('family-name')
+
+            if given_names and 'value' in given_names:
+                given = given_names['value']
+            if family_names and 'value' in family_names:
+                family = family_names['value']
+    return given, family
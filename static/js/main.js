@@ -27,6 +27,54 @@ function markdownToHtml(text) {
     .replace(/<p><\/p>/g, '');
 }
 
+// Envia a pergunta para /api/chat/stream e repassa o texto acumulado a
+// onDelta conforme os trechos chegam (eventos SSE "data: {...}").
+// Retorna a resposta completa.
+async function fetchChatReply(payload, onDelta) {
+  const resp = await fetch('/api/chat/stream', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(payload),
+  });
+  if (!resp.ok) throw new Error(`HTTP ${resp.status}`);
+
+  let reply = '';
+  let failed = false;
+  const handleEvent = (raw) => {
+    const line = raw.split('\n').find((l) => l.startsWith('data: '));
+    if (!line) return;
+    const event = JSON.parse(line.slice(6));
+    if (event.delta) {
+      reply += event.delta;
+      if (onDelta) onDelta(reply);
+    }
+    if (event.error) failed = true;
+  };
+
+  if (resp.body && window.TextDecoder) {
+    const reader = resp.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      let boundary;
+      while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+        handleEvent(buffer.slice(0, boundary));
+        buffer = buffer.slice(boundary + 2);
+      }
+    }
+    if (buffer.trim()) handleEvent(buffer);
+  } else {
+    // Navegadores sem ReadableStream recebem a resposta de uma só vez.
+    (await resp.text()).split('\n\n').forEach(handleEvent);
+  }
+
+  if (failed && !reply) throw new Error('chat stream failed');
+  return reply;
+}
+
 document.addEventListener('DOMContentLoaded', () => {
   // ----- Search integration with pagination -----
   const searchForm = document.getElementById('search-form');
@@ -458,17 +506,8 @@ document.addEventListener('DOMContentLoaded', () => {
           payload.reset = true;
           inlineFirstMessage = false;
         }
-        const resp = await fetch('/api/chat', {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify(payload),
-        });
-
-        const data = await resp.json();
-        const reply = data.response || data.message || translations[currentLang].error;
-
         // Limpa formatações Markdown
-        const plainText = reply
+        const toPlainText = (text) => text
           .replace(/\*\*(.*?)\*\*/g, '$1')
           .replace(/\*(.*?)\*/g, '$1')
           .replace(/__(.*?)__/g, '$1')
@@ -481,11 +520,23 @@ document.addEventListener('DOMContentLoaded', () => {
           .replace(/\n\s*\d+\.\s*/g, '\n')
           .replace(/\n{3,}/g, '\n\n');
 
+        // A bolha é preenchida à medida que a resposta chega.
         const botBubble = document.createElement('div');
         botBubble.className = 'chat-bubble bot';
+        let bubbleShown = false;
+        const reply = await fetchChatReply(payload, (partial) => {
+          if (!bubbleShown) {
+            inlineChatMessages.appendChild(botBubble);
+            bubbleShown = true;
+          }
+          botBubble.textContent = toPlainText(partial);
+          inlineChatMessages.scrollTop = inlineChatMessages.scrollHeight;
+        });
+
+        const plainText = toPlainText(reply || translations[currentLang].error);
         const recommendation = suggestions[currentLang] || suggestions.es;
         botBubble.textContent = `${plainText}\n\n${recommendation}`;
-        inlineChatMessages.appendChild(botBubble);
+        if (!bubbleShown) inlineChatMessages.appendChild(botBubble);
         inlineChatMessages.scrollTop = inlineChatMessages.scrollHeight;
 
       } catch (err) {
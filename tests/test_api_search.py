@@ -0,0 +1,132 @@
+"""Tests for the paginated search API."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+
+import pytest
+
+from olasis import search
+
+
+@pytest.fixture()
+def app_module(monkeypatch):
+    if "app" in sys.modules:
+        del sys.modules["app"]
+    module = importlib.import_module("app")
+    search.clear_cache()
+
+    calls: list[tuple[str, str]] = []
+
+    def fake_articles(query, *, per_page=5, mailto=None):
+        calls.append(("articles", query))
+        return [{"title": f"{query} article {i}"} for i in range(14)]
+
+    def fake_specialists(query, *, rows=5):
+        calls.append(("specialists", query))
+        return [{"full_name": f"{query} specialist {i}"} for i in range(5)]
+
+    monkeypatch.setattr(search, "search_articles", fake_articles)
+    monkeypatch.setattr(search, "search_specialists", fake_specialists)
+    module.upstream_calls = calls
+    return module
+
+
+def test_search_requires_query(app_module):
+    with app_module.app.test_client() as client:
+        response = client.get("/api/search?q=")
+
+    assert response.status_code == 400
+
+
+def test_search_paginates_both_sources(app_module):
+    with app_module.app.test_client() as client:
+        response = client.get("/api/search?q=solar&page=2")
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert [a["title"] for a in data["articles"]] == [
+        f"solar article {i}" for i in range(6, 12)
+    ]
+    assert data["specialists"] == []
+
+    pagination = data["pagination"]
+    assert pagination["current_page"] == 2
+    assert pagination["articles"] == {
+        "total": 14,
+        "total_pages": 3,
+        "has_next": True,
+        "has_prev": True,
+    }
+    assert pagination["specialists"]["total_pages"] == 1
+    assert pagination["specialists"]["has_next"] is False
+    assert sorted(app_module.upstream_calls) == [
+        ("articles", "solar"),
+        ("specialists", "solar"),
+    ]
+
+
+def test_search_results_are_cached(app_module):
+    with app_module.app.test_client() as client:
+        first = client.get("/api/search?q=solar%20%20energy")
+        second = client.get("/api/search?q=solar energy")
+
+    assert first.get_json() == second.get_json()
+    assert len(app_module.upstream_calls) == 2
+
+
+
+def test_cached_result_lists_are_not_shared(app_module):
+    articles, specialists = search.search_all("solar")
+    articles.clear()
+    specialists.reverse()
+
+    cached_articles, cached_specialists = search.search_all("solar")
+
+    assert len(cached_articles) == 14
+    assert cached_specialists[0]["full_name"] == "solar specialist 0"
+    assert len(app_module.upstream_calls) == 2
+
+def test_pages_share_one_upstream_fetch(app_module):
+    with app_module.app.test_client() as client:
+        client.get("/api/search?q=solar&page=1")
+        response = client.get("/api/search?q=solar&page=3")
+
+    assert [a["title"] for a in response.get_json()["articles"]] == [
+        "solar article 12",
+        "solar article 13",
+    ]
+    assert len(app_module.upstream_calls) == 2
+
+
+def test_repeat_page_reuses_encoded_body(app_module, monkeypatch):
+    with app_module.app.test_client() as client:
+        first = client.get("/api/search?q=solar")
+        monkeypatch.setattr(app_module, "search_all", None)
+        second = client.get("/api/search?q=solar")
+
+    assert second.status_code == 200
+    assert second.mimetype == "application/json"
+    assert second.data == first.data
+
+
+@pytest.mark.parametrize("page, status", [("abc", 400), ("0", 416), ("10", 416)])
+def test_invalid_pages_skip_upstream(app_module, page, status):
+    with app_module.app.test_client() as client:
+        response = client.get(f"/api/search?q=solar&page={page}")
+
+    assert response.status_code == status
+    assert app_module.upstream_calls == []
+
+
+def test_search_responses_can_be_revalidated(app_module):
+    with app_module.app.test_client() as client:
+        first = client.get("/api/search?q=solar")
+        second = client.get(
+            "/api/search?q=solar", headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+    assert first.headers["Cache-Control"].startswith("public, max-age=60")
+    assert second.status_code == 304
+    assert second.data == b""
@@ -0,0 +1,134 @@
+"""Tests for the /api/stats endpoint."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+
+import pytest
+
+ORCID_XML = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<search:search xmlns:search="http://www.orcid.org/ns/search" num-found="12345">'
+    b"<search:result/></search:search>"
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, payload=None, content=b""):
+        self.status_code = status_code
+        self._payload = payload
+        self.content = content
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    def __init__(self, fail=False, fail_orcid=False):
+        self.fail = fail
+        self.fail_orcid = fail_orcid
+        self.urls: list[str] = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        if self.fail or (self.fail_orcid and "orcid" in url):
+            raise ConnectionError("upstream down")
+        if "openalex" in url:
+            return FakeResponse(payload={"meta": {"count": 987}})
+        return FakeResponse(content=ORCID_XML)
+
+
+@pytest.fixture()
+def app_module():
+    if "app" in sys.modules:
+        del sys.modules["app"]
+    return importlib.import_module("app")
+
+
+def test_stats_reads_upstream_counts(app_module, monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(app_module, "_HTTP", session)
+
+    with app_module.app.test_client() as client:
+        data = client.get("/api/stats").get_json()
+
+    assert data["articles"] == 987
+    assert data["specialists"] == 12345
+    assert "error" not in data
+
+
+def test_stats_carry_cache_validators(app_module, monkeypatch):
+    monkeypatch.setattr(app_module, "_HTTP", FakeSession())
+
+    with app_module.app.test_client() as client:
+        first = client.get("/api/stats")
+        second = client.get("/api/stats", headers={"If-None-Match": first.headers["ETag"]})
+
+    assert "max-age=60" in first.headers["Cache-Control"]
+    assert second.status_code == 304
+
+
+def test_stats_are_cached_between_requests(app_module, monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(app_module, "_HTTP", session)
+
+    with app_module.app.test_client() as client:
+        client.get("/api/stats")
+        client.get("/api/stats")
+
+    assert len(session.urls) == 2
+
+
+def test_stats_fall_back_when_upstream_fails(app_module, monkeypatch):
+    monkeypatch.setattr(app_module, "_HTTP", FakeSession(fail=True))
+
+    with app_module.app.test_client() as client:
+        data = client.get("/api/stats").get_json()
+
+    assert data["articles"] == 200000000
+    assert data["specialists"] == 20005117
+    assert data["error"] == "Using cached data"
+
+
+def test_stats_fall_back_per_upstream(app_module, monkeypatch):
+    session = FakeSession(fail_orcid=True)
+    monkeypatch.setattr(app_module, "_HTTP", session)
+
+    with app_module.app.test_client() as client:
+        data = client.get("/api/stats").get_json()
+        client.get("/api/stats")
+
+    assert data["articles"] == 987
+    assert data["specialists"] == 20005117
+    assert data["error"] == "Using cached data"
+    assert len(session.urls) == 2
+
+
+def test_stats_keep_last_known_good_counts(app_module, monkeypatch):
+    monkeypatch.setattr(app_module, "_HTTP", FakeSession())
+    with app_module.app.test_client() as client:
+        client.get("/api/stats")
+
+    app_module._STATS_CACHE.clear()
+    monkeypatch.setattr(app_module, "_HTTP", FakeSession(fail=True))
+    with app_module.app.test_client() as client:
+        data = client.get("/api/stats").get_json()
+
+    assert data["articles"] == 987
+    assert data["specialists"] == 12345
+    assert data["error"] == "Using cached data"
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        (ORCID_XML, 12345),
+        (b'<search:search xmlns:search="x" num-found = "42"/>', 42),
+        (b"<root><search num-found='7'/></root>", 7),
+        (b"<root/>", None),
+        (b"<broken", None),
+    ],
+)
+def test_parse_orcid_num_found(app_module, content, expected):
+    assert app_module._parse_orcid_num_found(content) == expected
@@ -0,0 +1,130 @@
+"""Tests for the OpenAlex article helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from olasis import articles
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    articles.clear_article_cache()
+    yield
+    articles.clear_article_cache()
+
+
+def _work(title, url=None, oa_url=None):
+    return {
+        "id": f"https://openalex.org/{title}",
+        "display_name": title,
+        "publication_year": 2024,
+        "authorships": [{"author": {"display_name": "Ana Lima"}}],
+        "primary_location": {"landing_page_url": url},
+        "best_oa_location": {"landing_page_url": oa_url},
+    }
+
+
+def test_search_articles_projects_results(monkeypatch):
+    calls = []
+
+    def fake_http_get(url, *, headers=None, params=None, timeout=10.0):
+        calls.append(params)
+        return {"results": [_work("W1", oa_url="https://oa.example/w1")]}
+
+    monkeypatch.setattr(articles, "http_get", fake_http_get)
+
+    assert articles.search_articles("solar") == [{
+        "title": "W1",
+        "authors": ["Ana Lima"],
+        "year": 2024,
+        "openalex_id": "https://openalex.org/W1",
+        "doi": None,
+        "url": "https://oa.example/w1",
+    }]
+    assert set(calls[0]["select"].split(",")) >= set(_work("W1"))
+
+
+def test_cached_results_are_not_shared_with_callers(monkeypatch):
+    monkeypatch.setattr(
+        articles, "http_get", lambda url, **kwargs: {"results": [_work("W1")]}
+    )
+
+    first = articles.search_articles("solar")
+    first[0]["title"] = "changed"
+    first[0]["authors"].append("Intruder")
+    second = articles.search_articles("solar")
+    second[0]["year"] = 1900
+
+    third = articles.search_articles("solar")
+
+    assert second[0]["title"] == "W1"
+    assert second[0]["authors"] == ["Ana Lima"]
+    assert third[0]["year"] == 2024
+
+
+def test_search_articles_many_keeps_query_order(monkeypatch):
+    def fake_http_get(url, *, headers=None, params=None, timeout=10.0):
+        return {"results": [_work(params["search"])]}
+
+    monkeypatch.setattr(articles, "http_get", fake_http_get)
+
+    results = articles.search_articles_many(["wind", "solar", "hydro"])
+
+    assert [r[0]["title"] for r in results] == ["wind", "solar", "hydro"]
+    assert articles.search_articles_many([]) == []
+
+
+def test_get_works_by_ids_batches_requests(monkeypatch):
+    calls: list[dict] = []
+
+    def fake_http_get(url, *, headers=None, params=None, timeout=10.0):
+        calls.append(params)
+        requested = params["filter"].removeprefix("openalex:").split("|")
+        return {"results": [_work(work_id) for work_id in reversed(requested)]}
+
+    monkeypatch.setattr(articles, "http_get", fake_http_get)
+
+    ids = [f"W{i}" for i in range(60)] + ["https://openalex.org/W3"]
+    works = articles.get_works_by_ids(ids)
+
+    assert [w["title"] for w in works] == [f"W{i}" for i in range(60)]
+    assert [c["per_page"] for c in calls] == [50, 10]
+
+
+def test_repeated_searches_are_memoised(monkeypatch):
+    calls: list[dict] = []
+
+    def fake_http_get(url, *, headers=None, params=None, timeout=10.0):
+        calls.append(params)
+        return {"results": [_work("W1")]}
+
+    monkeypatch.setattr(articles, "http_get", fake_http_get)
+
+    first = articles.search_articles("solar energy")
+    first.clear()
+    second = articles.search_articles(" solar energy ")
+
+    assert len(calls) == 1
+    assert [w["title"] for w in second] == ["W1"]
+
+
+def test_search_articles_paginated_stitches_pages_in_order(monkeypatch):
+    calls = []
+
+    def fake_http_get(url, *, headers=None, params=None, timeout=10.0):
+        calls.append(params)
+        page = params["page"]
+        # The last work of each page reappears at the top of the next one.
+        first = (page - 1) * params["per_page"]
+        return {"results": [
+            _work(f"W{n}") for n in range(max(first - 1, 0), first + params["per_page"])
+        ]}
+
+    monkeypatch.setattr(articles, "http_get", fake_http_get)
+
+    works = articles.search_articles_paginated("solar", total=450)
+
+    assert sorted(call["page"] for call in calls) == [1, 2, 3]
+    assert {call["per_page"] for call in calls} == {200}
+    assert [work["title"] for work in works] == [f"W{n}" for n in range(450)]
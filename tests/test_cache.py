@@ -0,0 +1,57 @@
+"""Unit tests for the in-process TTL cache."""
+
+from __future__ import annotations
+
+from olasis.cache import SemanticCache, TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=4, ttl=10, timer=clock)
+    cache.set("key", "value")
+
+    clock.now = 9.9
+    assert cache.get("key") == "value"
+
+    clock.now = 10.0
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get("c") == 3
+
+
+def test_semantic_cache_matches_similar_vectors_within_namespace():
+    cache = SemanticCache(maxsize=4, threshold=0.9)
+    cache.set("en", [1.0, 0.0, 0.1], "answer")
+
+    assert cache.get("en", [2.0, 0.0, 0.3]) == "answer"
+    assert cache.get("en", [0.0, 1.0, 0.0]) is None
+    assert cache.get("pt", [1.0, 0.0, 0.1]) is None
+
+
+def test_semantic_cache_evicts_oldest_entry():
+    cache = SemanticCache(maxsize=1, threshold=0.9)
+    cache.set("en", [1.0, 0.0], "old")
+    cache.set("en", [0.0, 1.0], "new")
+
+    assert cache.get("en", [1.0, 0.0]) is None
+    assert cache.get("en", [0.0, 1.0]) == "new"
+    assert len(cache) == 1
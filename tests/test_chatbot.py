@@ -0,0 +1,450 @@
+"""Tests for the multilingual OLABOT chatbot (``olasis.chatbot``)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from olasis import chatbot as chatbot_module
+from olasis.cache import SemanticCache
+from olasis.chatbot import Chatbot
+
+
+class FakeModels:
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.prompts: list[str] = []
+        self.configs: list[dict] = []
+        self.embedded: list[str] = []
+        self.embeddings: dict[str, list[float]] = {}
+
+    def generate_content(self, *, model, contents, config):
+        self.prompts.append(contents)
+        self.configs.append(config)
+        return SimpleNamespace(text=self.replies.pop(0))
+
+    def embed_content(self, *, model, contents):
+        self.embedded.append(contents)
+        values = self.embeddings[contents]
+        return SimpleNamespace(embeddings=[SimpleNamespace(values=values)])
+
+    def generate_content_stream(self, *, model, contents, config):
+        self.prompts.append(contents)
+        reply = self.replies.pop(0)
+        for start in range(0, len(reply), 7):
+            yield SimpleNamespace(text=reply[start:start + 7])
+
+
+class FakeAsyncModels:
+    def __init__(self, models):
+        self._models = models
+
+    async def generate_content(self, *, model, contents, config):
+        await asyncio.sleep(0)
+        return self._models.generate_content(model=model, contents=contents, config=config)
+
+
+@pytest.fixture()
+def make_bot():
+    def _make(*replies):
+        bot = Chatbot(api_key=None)
+        models = FakeModels(replies)
+        bot._client = SimpleNamespace(
+            models=models, aio=SimpleNamespace(models=FakeAsyncModels(models))
+        )
+        return bot
+
+    return _make
+
+
+def test_first_answer_starts_with_intro(make_bot):
+    bot = make_bot("Solar panels convert sunlight into electricity.")
+
+    answer = bot.ask("What is solar energy?", lang="en")
+
+    assert answer == "Hello! How are you? Solar panels convert sunlight into electricity."
+    assert bot.first_answer is False
+    assert "'Hello! How are you?'" in bot._client.models.configs[0]["system_instruction"]
+    assert bot._client.models.prompts[0] == "User: What is solar energy?"
+
+
+def test_follow_up_strips_greetings_and_uses_history(make_bot):
+    bot = make_bot("First answer.", "Hello! Hi, wind turbines use kinetic energy.")
+
+    bot.ask("What is solar energy?", lang="en")
+    answer = bot.ask("And wind?", lang="en")
+
+    assert answer == "wind turbines use kinetic energy."
+    assert "User: What is solar energy?" in bot._client.models.prompts[1]
+    assert "OLABOT: Hello! How are you? First answer." in bot._client.models.prompts[1]
+
+
+def test_follow_up_strips_a_run_of_greetings(make_bot):
+    bot = make_bot("First answer.", "Hi! Hello, good morning: wind turbines spin.")
+
+    bot.ask("What is solar energy?", lang="en")
+
+    assert bot.ask("And wind?", lang="en") == "wind turbines spin."
+
+
+def test_legacy_intros_are_removed_anywhere(make_bot):
+    bot = make_bot(
+        "Hello! I am OLABOT, a research assistant for OLASIS 4.0. Solar is clean. "
+        "Hello! I'm OLABOT, the virtual assistant for the OLASIS platform. Wind too."
+    )
+
+    answer = bot.ask("What is solar energy?", lang="en")
+
+    assert " ".join(answer.split()) == "Hello! How are you? Solar is clean. Wind too."
+
+
+def test_stream_matches_buffered_answer(make_bot):
+    reply = (
+        "Olá! Sou a OLABOT, a assistente virtual da plataforma OLASIS. "
+        "A energia solar fotovoltaica converte a luz do sol em eletricidade "
+        "por meio de células semicondutoras, geralmente de silício cristalino."
+    )
+    buffered = make_bot(reply).ask("O que é energia solar?", lang="pt")
+
+    streaming_bot = make_bot(reply)
+    fragments = list(streaming_bot.ask_stream("O que é energia solar?", lang="pt"))
+
+    assert len(fragments) > 1
+    assert "".join(fragments) == buffered
+    assert streaming_bot._conversation_log[-1]["content"] == buffered
+
+
+def test_stream_sends_the_intro_before_the_model_replies(make_bot):
+    bot = make_bot("Solar panels convert sunlight into electricity.")
+    stream = bot.ask_stream("What is solar energy?", lang="en")
+
+    assert next(stream) == "Hello! How are you?"
+    assert bot._client.models.prompts == []
+    assert "".join(stream) == " Solar panels convert sunlight into electricity."
+
+
+def test_stream_reports_errors_after_the_intro(make_bot):
+    bot = make_bot()  # no replies: the fake model raises IndexError
+
+    fragments = list(bot.ask_stream("What is solar energy?", lang="en"))
+
+    assert fragments == [
+        "Hello! How are you?",
+        " [Sorry, I couldn't generate a response due to an API error.]",
+    ]
+
+
+def test_disconnected_stream_releases_the_intro(make_bot):
+    bot = make_bot("Solar panels convert sunlight into electricity.")
+    stream = bot.ask_stream("What is solar energy?", lang="en")
+
+    assert next(stream) == "Hello! How are you?"
+    stream.close()
+
+    assert bot.first_answer is True
+    assert not bot._conversation_log
+
+
+def test_repeated_fresh_question_is_served_from_cache(make_bot):
+    bot = make_bot("Solar panels convert sunlight into electricity.")
+
+    first = bot.ask("What is solar energy?", lang="en")
+    second = bot.ask("What is solar energy?", lang="en", reset=True)
+
+    assert second == first
+    assert len(bot._client.models.prompts) == 1
+    assert bot.get_session_stats()["cache_hits"] == 1
+    assert bot._conversation_log[-1]["content"] == first
+
+
+def test_cache_ignores_case_and_spacing_of_the_question(make_bot):
+    bot = make_bot("Solar panels convert sunlight into electricity.", "Unused.")
+
+    first = bot.ask("What is solar energy?", lang="en")
+    second = bot.ask("  what is   SOLAR energy? ", lang="en", reset=True)
+
+    assert second == first
+    assert len(bot._client.models.prompts) == 1
+
+
+def test_cache_is_keyed_on_conversation_history(make_bot):
+    bot = make_bot("First answer.", "Second answer.", "Third answer.")
+
+    bot.ask("What is solar energy?", lang="en")
+    bot.ask("And wind?", lang="en")
+    bot.ask("What is solar energy?", lang="en", reset=True)
+    answer = bot.ask("And wind?", lang="en")
+
+    assert answer == "Second answer."
+    assert len(bot._client.models.prompts) == 2
+
+
+def test_semantic_cache_answers_paraphrases_of_opening_questions(make_bot):
+    bot = make_bot("OLASIS is a research platform.", "Unused.")
+    bot._semantic_cache = SemanticCache(threshold=0.95)
+    bot._client.models.embeddings = {
+        "What is OLASIS?": [1.0, 0.1, 0.0],
+        "Tell me about OLASIS": [1.0, 0.12, 0.0],
+    }
+
+    first = bot.ask("What is OLASIS?", lang="en")
+    second = bot.ask("Tell me about OLASIS", lang="en", reset=True)
+
+    assert second == first
+    assert len(bot._client.models.prompts) == 1
+
+
+def test_semantic_cache_skips_follow_ups_and_is_off_by_default(make_bot):
+    bot = make_bot("First answer.", "Second answer.")
+    bot.ask("What is OLASIS?", lang="en")
+    bot.ask("And ORCID?", lang="en")
+    assert bot._client.models.embedded == []
+
+    bot = make_bot("First answer.", "Second answer.")
+    bot._semantic_cache = SemanticCache(threshold=0.95)
+    bot._client.models.embeddings = {"What is OLASIS?": [1.0, 0.0]}
+    bot.ask("What is OLASIS?", lang="en")
+    bot.ask("And ORCID?", lang="en")
+    assert bot._client.models.embedded == ["What is OLASIS?"]
+
+
+def test_high_temperature_replies_are_not_cached(make_bot):
+    bot = make_bot("First take.", "Second take.")
+    bot.temperature = 0.9
+
+    bot.ask("Tell me a story", lang="en")
+    answer = bot.ask("Tell me a story", lang="en", reset=True)
+
+    assert answer == "Hello! How are you? Second take."
+    assert bot.get_session_stats()["cache_hits"] == 0
+
+
+def test_ask_many_answers_in_order(make_bot):
+    bot = make_bot("Answer one.", "Answer two.", "Answer three.")
+
+    answers = asyncio.run(bot.ask_many(["Q1?", "Q2?", "Q3?"], lang="en"))
+
+    assert answers[0] == "Hello! How are you? Answer one."
+    assert [answer.endswith(expected) for answer, expected in zip(
+        answers, ["Answer one.", "Answer two.", "Answer three."]
+    )] == [True, True, True]
+    assert len(bot._conversation_log) == 6
+
+
+def test_identical_concurrent_asks_share_one_call(make_bot):
+    bot = make_bot("Hi there.", "Solar panels convert sunlight into electricity.")
+    bot.ask("Hello", lang="en")
+
+    answers = asyncio.run(bot.ask_many(["What is solar energy?"] * 3, lang="en"))
+
+    assert answers == ["Solar panels convert sunlight into electricity."] * 3
+    assert len(bot._client.models.prompts) == 2
+    assert bot._inflight == {}
+
+
+def test_conversation_log_keeps_the_last_five_exchanges(make_bot):
+    bot = make_bot(*(f"Answer {n}." for n in range(6)))
+
+    for n in range(6):
+        bot.ask(f"Question {n}?", lang="en")
+
+    assert len(bot._conversation_log) == 10
+    assert bot._conversation_log[0]["content"] == "Question 1?"
+
+
+def test_concurrent_asks_keep_question_answer_pairs_together(make_bot):
+    bot = make_bot(*(f"Answer {n}." for n in range(40)))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda n: bot.ask(f"Question {n}?", lang="en", reset=True), range(40)))
+
+    roles = [entry["role"] for entry in bot._conversation_log]
+    assert roles == ["user", "assistant"] * (len(roles) // 2)
+
+
+def test_concurrent_first_questions_get_one_intro(make_bot):
+    bot = make_bot("Wind turbines spin.", "Solar panels shine.")
+    barrier = threading.Barrier(2)
+    generate = bot._client.models.generate_content
+
+    def generate_together(**kwargs):
+        barrier.wait(timeout=5)
+        return generate(**kwargs)
+
+    bot._client.models.generate_content = generate_together
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        answers = list(pool.map(lambda q: bot.ask(q, lang="en"), ["Wind?", "Sun?"]))
+
+    assert sum(answer.startswith("Hello! How are you?") for answer in answers) == 1
+    system_rules = {config["system_instruction"] for config in bot._client.models.configs}
+    assert len(system_rules) == 2
+
+
+def test_conversation_resumes_from_checkpoint(tmp_path):
+    path = tmp_path / "session.jsonl"
+    bot = Chatbot(api_key=None, checkpoint_path=path)
+    bot._client = SimpleNamespace(models=FakeModels(["Solar panels convert sunlight."]))
+    bot.ask("What is solar energy?", lang="en")
+    bot.close()
+
+    resumed = Chatbot(api_key=None, checkpoint_path=path)
+    resumed.close()
+
+    assert resumed.first_answer is False
+    assert list(resumed._conversation_log) == list(bot._conversation_log)
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_checkpoint_replay_skips_damaged_lines(tmp_path):
+    path = tmp_path / "session.jsonl"
+    path.write_text(
+        '{"role": "user", "content": "What is solar energy?", "lang": "en"}\n'
+        '[1, 2]\n'
+        '{"role": "assistant"}\n'
+        '{"role": "assistant", "content": "Sunlight.", "lang": "en"}\n'
+        '{"role": "user", "content": "And wi',
+        encoding="utf-8",
+    )
+
+    bot = Chatbot(api_key=None, checkpoint_path=path)
+    bot.close()
+
+    assert [entry["content"] for entry in bot._conversation_log] == [
+        "What is solar energy?", "Sunlight."
+    ]
+    assert bot.first_answer is False
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_checkpoint_is_compacted_to_the_retained_log(tmp_path, monkeypatch):
+    monkeypatch.setattr(chatbot_module, "_CHECKPOINT_COMPACT_TURNS", 3)
+    path = tmp_path / "session.jsonl"
+    bot = Chatbot(api_key=None, checkpoint_path=path)
+    bot._client = SimpleNamespace(models=FakeModels([f"Answer {n}." for n in range(8)]))
+
+    for n in range(7):
+        bot.ask(f"Question {n}?", lang="en")
+    assert len(path.read_text(encoding="utf-8").splitlines()) <= 10 + 2 * 3
+
+    bot.ask("Question 7?", lang="en")
+    bot.close()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 10
+    assert '"Question 7?"' in lines[-2]
+
+
+def test_checkpoint_is_disabled_when_it_cannot_be_reopened(tmp_path, monkeypatch):
+    monkeypatch.setattr(chatbot_module, "_CHECKPOINT_COMPACT_TURNS", 1)
+    path = tmp_path / "session.jsonl"
+    bot = Chatbot(api_key=None, checkpoint_path=path)
+    bot._client = SimpleNamespace(models=FakeModels(["First.", "Second."]))
+
+    def fail_open(*args, **kwargs):
+        raise PermissionError("read-only filesystem")
+
+    monkeypatch.setattr(chatbot_module.os, "open", fail_open)
+    assert bot.ask("One?", lang="en").endswith("First.")
+    assert bot._checkpoint_fd is None
+    assert bot.ask("Two?", lang="en") == "Second."
+    bot.close()
+
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_reset_clears_the_checkpoint(tmp_path):
+    path = tmp_path / "session.jsonl"
+    bot = Chatbot(api_key=None, checkpoint_path=path)
+    bot._client = SimpleNamespace(models=FakeModels(["First.", "Second."]))
+    bot.ask("One?", lang="en")
+    bot.ask("Two?", lang="en", reset=True)
+    bot.close()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert '"Two?"' in lines[0]
+
+
+def test_session_stats_count_questions_beyond_kept_history(monkeypatch):
+    monkeypatch.setattr("olasis.chatbot._MAX_QUESTION_HISTORY", 2)
+    bot = Chatbot(api_key=None)
+
+    for question in ("one", "two", "three"):
+        bot.ask(question, lang="en")
+
+    stats = bot.get_session_stats()
+    assert stats["model"] == bot.model_info["model"] == "gemini-2.5-flash"
+    assert stats["total_questions"] == 3
+    assert stats["last_question"] == "three"
+    assert list(bot._history) == ["two", "three"]
+
+
+def test_bots_with_the_same_key_share_one_client(monkeypatch):
+    created = []
+
+    class FakeClient:
+        def __init__(self, *, api_key):
+            created.append(api_key)
+
+    monkeypatch.setattr(
+        chatbot_module, "optional_genai", lambda: SimpleNamespace(Client=FakeClient)
+    )
+    monkeypatch.setattr(chatbot_module, "_GENAI_CLIENTS", {})
+
+    first = Chatbot(api_key="key-a")
+    second = Chatbot(api_key="key-a")
+    other = Chatbot(api_key="key-b")
+
+    assert first._client is second._client
+    assert other._client is not first._client
+    assert created == ["key-a", "key-b"]
+
+
+@pytest.mark.parametrize("requested, expected", [("pt-BR", "pt"), ("EN", "en"), ("Es", "es")])
+def test_language_codes_are_normalised(requested, expected):
+    bot = Chatbot(api_key=None)
+
+    assert bot._start_turn("?", requested, reset=False) == expected
+
+
+@pytest.mark.parametrize(
+    "question, expected",
+    [("O que é adaptação climática?", "pt"), ("¿Qué año es?", "es"), ("Niño y niña", "es")],
+)
+def test_distinctive_letters_skip_langdetect(monkeypatch, question, expected):
+    def _fail(text):
+        raise AssertionError("langdetect should not run")
+
+    monkeypatch.setattr(chatbot_module, "_load_detect", lambda: _fail)
+    chatbot_module._detect_language.cache_clear()
+
+    assert chatbot_module._detect_language(question) == expected
+
+
+
+@pytest.mark.parametrize(
+    "question", ["Qué clima tiene São Paulo", "¿Qué clima tiene São Paulo?"]
+)
+def test_a_single_distinctive_letter_falls_back_to_langdetect(monkeypatch, question):
+    checked = []
+
+    def _detect(text):
+        checked.append(text)
+        return "es"
+
+    monkeypatch.setattr(chatbot_module, "_load_detect", lambda: _detect)
+    chatbot_module._detect_language.cache_clear()
+
+    assert chatbot_module._detect_language(question) == "es"
+    assert checked == [question]
+
+def test_unavailable_client_returns_setup_hint():
+    bot = Chatbot(api_key=None)
+
+    assert bot.ask("hello", lang="en").startswith("[Chatbot not available")
+    assert list(bot.ask_stream("hola", lang="es"))[0].startswith("[Chatbot no disponible")
@@ -0,0 +1,272 @@
+"""Tests for the research-focused OLABOT (``olasis.chatbot_v2``)."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from olasis import chatbot as chatbot_module
+from olasis import chatbot_v2 as chatbot_v2_module
+from olasis.cache import TTLCache
+from olasis.chatbot_v2 import OlaBot
+from olasis.prompt_engineering import PromptBuilder, PromptTemplates
+
+
+class FakeModels:
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.prompts: list = []
+        self.configs: list[dict] = []
+        self.embeddings: dict[str, list[float]] = {}
+
+    def generate_content(self, *, model, contents, config):
+        self.prompts.append(contents)
+        self.configs.append(config)
+        return SimpleNamespace(text=self.replies.pop(0))
+
+    def generate_content_stream(self, *, model, contents, config):
+        self.prompts.append(contents)
+        self.configs.append(config)
+        reply = self.replies.pop(0)
+        for start in range(0, len(reply), 5):
+            yield SimpleNamespace(text=reply[start:start + 5])
+
+    def embed_content(self, *, model, contents):
+        values = self.embeddings[contents]
+        return SimpleNamespace(embeddings=[SimpleNamespace(values=values)])
+
+
+class EchoAsyncModels:
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_content(self, *, model, contents, config):
+        self.calls += 1
+        await asyncio.sleep(0)
+        question = contents[-1]["parts"][-1]["text"].removeprefix("Pergunta: ")
+        return SimpleNamespace(text=f"Answer to {question}")
+
+
+def make_bot(replies, **kwargs):
+    bot = OlaBot(api_key=None, **kwargs)
+    bot._client = SimpleNamespace(
+        models=FakeModels(replies), aio=SimpleNamespace(models=EchoAsyncModels())
+    )
+    return bot
+
+
+def test_repeated_question_is_served_from_cache():
+    bot = make_bot(["Photosynthesis converts light into chemical energy."])
+
+    first = bot.ask("What is photosynthesis?", context_type="simple")
+    bot.clear_history()
+    second = bot.ask("  what is  PHOTOSYNTHESIS? ", context_type="simple")
+
+    assert second == first
+    assert len(bot._client.models.prompts) == 1
+    assert bot.get_session_stats()["cache_hits"] == 1
+
+
+def test_cache_hits_do_not_extend_the_ttl():
+    now = [0.0]
+    bot = make_bot(["Old answer.", "New answer."])
+    bot._response_cache = TTLCache(maxsize=10, ttl=10, timer=lambda: now[0])
+
+    bot.ask("What is photosynthesis?", context_type="simple")
+    now[0] = 8.0
+    assert bot.ask("What is photosynthesis?", context_type="simple") == "Old answer."
+    now[0] = 12.0
+    assert bot.ask("What is photosynthesis?", context_type="simple") == "New answer."
+
+
+def test_cache_keeps_punctuation_apart():
+    bot = make_bot(["About C plus plus.", "About C sharp."])
+
+    assert bot.ask("C++?", context_type="simple") == "About C plus plus."
+    assert bot.ask("C#?", context_type="simple") == "About C sharp."
+
+
+def test_cache_is_keyed_by_the_history_sent():
+    # Só o primeiro turno difere: fica fora dos 3 resumos recentes, mas vai no prompt.
+    bot = make_bot([
+        "Solar.", "A.", "B.", "C.", "More on solar.",
+        "Wind.", "A.", "B.", "C.", "More on wind.",
+    ])
+
+    answers = []
+    for topic in ("Tema: energia solar", "Tema: energia eólica"):
+        bot.clear_history()
+        for question in (topic, "Um?", "Dois?", "Três?", "Fale mais"):
+            answer = bot.ask(question)
+        answers.append(answer)
+
+    assert answers == ["More on solar.", "More on wind."]
+
+
+def test_cache_is_keyed_by_temperature():
+    bot = make_bot(["First answer.", "Second answer."])
+
+    bot.ask("What is photosynthesis?", context_type="simple")
+    bot.clear_history()
+    bot.set_temperature(0.2)
+    bot.ask("What is photosynthesis?", context_type="simple")
+
+    assert len(bot._client.models.prompts) == 2
+
+
+def test_semantic_cache_matches_paraphrases():
+    bot = make_bot(["Photosynthesis converts light."], semantic_cache_threshold=0.85)
+    bot._client.models.embeddings = {
+        "What is photosynthesis?": [1.0, 0.0],
+        "Explain photosynthesis": [0.95, 0.1],
+    }
+
+    first = bot.ask("What is photosynthesis?", context_type="simple")
+    bot.clear_history()
+    second = bot.ask("Explain photosynthesis", context_type="simple")
+
+    assert second == first
+    assert len(bot._client.models.prompts) == 1
+
+
+def test_persona_is_sent_as_system_instruction():
+    bot = make_bot(["Answer."])
+
+    bot.ask("What is photosynthesis?", context_type="simple")
+
+    config = bot._client.models.configs[0]
+    contents = bot._client.models.prompts[0]
+    assert config["system_instruction"].startswith("Você é OLABOT")
+    assert "OLABOT" not in str(contents)
+    assert contents[-1]["parts"][-1]["text"].endswith("What is photosynthesis?")
+
+
+def test_default_context_sends_persona_and_history_as_structured_turns():
+    bot = make_bot(["Photosynthesis converts light.", "Chlorophyll absorbs it."])
+
+    bot.ask("O que é fotossíntese?")
+    bot.ask("E a clorofila?")
+
+    configs = bot._client.models.configs
+    first, second = bot._client.models.prompts
+    assert bot.prompt_builder is not None
+    assert configs[0]["system_instruction"] == PromptTemplates.BASE_SYSTEM_PROMPT
+    assert configs[1] is configs[0]
+    assert len(first) == 1
+    dynamic, question = first[0]["parts"]
+    assert "DATA ATUAL" in dynamic["text"]
+    assert "Você é OLABOT" not in dynamic["text"]
+    assert question["text"] == "Pergunta: O que é fotossíntese?"
+    assert second[:2] == [
+        {"role": "user", "parts": [{"text": "O que é fotossíntese?"}]},
+        {"role": "model", "parts": [{"text": "Photosynthesis converts light."}]},
+    ]
+    assert second[-1]["parts"][-1]["text"] == "Pergunta: E a clorofila?"
+    assert bot.history[0]["context_type"] == "concept"
+
+
+def test_replayed_history_is_bounded_and_trimmed_in_blocks():
+    long_reply = "Energia solar. " * 40
+    bot = make_bot([long_reply] + [f"Answer {i}." for i in range(1, 10)])
+
+    for i in range(10):
+        bot.ask(f"Pergunta {i} sobre energia?")
+
+    prompts = bot._client.models.prompts
+    assert prompts[1][1]["parts"][0]["text"] == long_reply[:300] + "..."
+    # Turnos 7 a 9 reenviam o mesmo início; o corte acontece de 3 em 3.
+    assert prompts[7][:6] == prompts[8][:6] == prompts[9][:6]
+    assert prompts[7][0]["parts"][0]["text"] == "Pergunta 3 sobre energia?"
+    assert max(len(contents) for contents in prompts) == 2 * 6 + 1
+
+
+def test_history_keeps_the_latest_interactions():
+    bot = make_bot([f"Answer {i}." for i in range(7)])
+
+    for i in range(7):
+        bot.ask(f"Question {i}?", context_type="simple")
+
+    assert [item["question"] for item in bot.history] == [f"Question {i}?" for i in range(2, 7)]
+
+
+def test_ask_many_answers_in_order():
+    bot = make_bot([])
+
+    answers = bot.ask_many(["One?", "Two?", "One?"], context_type="simple", concurrency=2)
+
+    assert answers == ["Answer to One?", "Answer to Two?", "Answer to One?"]
+    assert bot.get_session_stats()["total_queries"] == 3
+
+
+def test_ask_stream_yields_chunks_and_records_the_answer():
+    bot = make_bot(["Photosynthesis converts light."])
+
+    chunks = list(bot.ask_stream("What is photosynthesis?", context_type="simple"))
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == "Photosynthesis converts light."
+    assert bot.history[-1]["response"] == "Photosynthesis converts light."
+    bot.clear_history()
+    assert list(bot.ask_stream("What is photosynthesis?", context_type="simple")) == [
+        "Photosynthesis converts light."
+    ]
+
+
+def test_bots_share_the_client_for_their_key(monkeypatch):
+    created = []
+
+    class FakeClient:
+        def __init__(self, *, api_key):
+            created.append(api_key)
+
+    fake_genai = SimpleNamespace(Client=FakeClient)
+    monkeypatch.setattr(chatbot_module, "optional_genai", lambda: fake_genai)
+    monkeypatch.setattr(chatbot_v2_module, "optional_genai", lambda: fake_genai)
+    monkeypatch.setattr(chatbot_module, "_GENAI_CLIENTS", {})
+
+    first = OlaBot(api_key="key-a")
+    second = OlaBot(api_key="key-a")
+
+    assert first._client is second._client
+    assert created == ["key-a"]
+
+
+def test_generation_config_is_reused_until_temperature_changes():
+    bot = make_bot(["One.", "Two.", "Three."])
+
+    bot.ask("First?", context_type="simple")
+    bot.ask("Second?", context_type="simple")
+    bot.set_temperature(0.3)
+    bot.ask("Third?", context_type="simple")
+
+    configs = bot._client.models.configs
+    assert configs[0] is configs[1]
+    assert configs[2]["temperature"] == 0.3
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ("Onde encontrar artigos sobre diabetes?", "search"),
+        ("Quero pesquisar sobre solos", "search"),
+        ("Há estudos recentes sobre secas?", "search"),
+        ("Publicações de 2020 sobre enchentes", "search"),
+        ("Monte uma bibliografia sobre clima", "search"),
+        ("Preciso de referências sobre ilhas de calor", "search"),
+        ("Qual procedimento usar para coleta de dados?", "methodology"),
+        ("Como fazer uma revisão sistemática?", "methodology"),
+        ("Como pesquisar o tema com rigor?", "search"),  # "pesquisar" tem prioridade
+        ("Qual abordagem é melhor?", "methodology"),
+        ("Que técnica usar?", "methodology"),
+        ("Existem protocolos para isso?", "methodology"),
+        ("O que significa resiliência urbana?", "concept"),
+        ("Qual o significado de adaptação?", "concept"),
+        ("Como definir vulnerabilidade?", "concept"),
+        ("Quero entender infraestrutura verde", "concept"),
+        ("Estou começando meu doutorado", "general"),
+    ],
+)
+def test_detect_context_type(message, expected):
+    assert PromptBuilder().detect_context_type(message) == expected
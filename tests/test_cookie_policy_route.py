@@ -94,4 +94,48 @@ def test_cookie_policy_template_backward_compatibility(monkeypatch, module_name)
 
     assert response.status_code == 200
     assert render_calls[0] == "cookie_policy.html"
-    assert "cookie-policy.html" in render_calls
\ No newline at end of file
+    assert "cookie-policy.html" in render_calls
+
+
+def test_cookie_policy_rendered_once_per_day(monkeypatch):
+    """The main app reuses the rendered policy for repeat requests."""
+
+    if "app" in sys.modules:
+        del sys.modules["app"]
+
+    module = importlib.import_module("app")
+
+    render_calls: list[str] = []
+    original_render = module.render_template
+
+    def counting_render(template_name: str, **context):
+        render_calls.append(template_name)
+        return original_render(template_name, **context)
+
+    monkeypatch.setattr(module, "render_template", counting_render)
+
+    with module.app.test_client() as client:
+        first = client.get("/privacy/cookies")
+        second = client.get("/cookie-policy")
+
+    assert first.data == second.data
+    assert render_calls == ["cookie_policy.html"]
+
+
+def test_cookie_policy_revalidation():
+    """A matching If-None-Match yields 304 without re-sending the page."""
+
+    if "app" in sys.modules:
+        del sys.modules["app"]
+
+    module = importlib.import_module("app")
+
+    with module.app.test_client() as client:
+        first = client.get("/privacy/cookies")
+        second = client.get(
+            "/privacy/cookies", headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+    assert first.headers["Cache-Control"].startswith("public")
+    assert second.status_code == 304
+    assert second.data == b""
@@ -0,0 +1,36 @@
+"""Tests for the cached landing page."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+
+import pytest
+
+
+@pytest.fixture()
+def app_module():
+    if "app" in sys.modules:
+        del sys.modules["app"]
+    return importlib.import_module("app")
+
+
+def test_index_is_rendered_once_and_revalidated(app_module, monkeypatch):
+    render_calls: list[str] = []
+    original_render = app_module.render_template
+
+    def counting_render(template_name: str, **context):
+        render_calls.append(template_name)
+        return original_render(template_name, **context)
+
+    monkeypatch.setattr(app_module, "render_template", counting_render)
+
+    with app_module.app.test_client() as client:
+        first = client.get("/")
+        second = client.get("/", headers={"If-None-Match": first.headers["ETag"]})
+
+    assert first.status_code == 200
+    assert b"/media/tutorial/en" in first.data
+    assert first.headers["Cache-Control"] == "public, max-age=300"
+    assert second.status_code == 304
+    assert render_calls == ["index.html"]
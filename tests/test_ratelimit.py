@@ -0,0 +1,40 @@
+"""Unit tests for the client-side token bucket."""
+
+from __future__ import annotations
+
+import pytest
+
+from olasis.ratelimit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+
+
+def test_burst_up_to_capacity_then_waits():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, timer=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(12)]
+
+    assert waits[:10] == [0.0] * 10
+    assert waits[10:] == pytest.approx([0.1, 0.2])
+    assert clock.slept == pytest.approx([0.1, 0.2])
+
+
+def test_tokens_refill_over_time():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=1, timer=clock, sleep=clock.sleep)
+
+    assert bucket.acquire() == 0.0
+    clock.now = 0.5
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(0.5)
@@ -0,0 +1,27 @@
+"""Unit tests for the shared search helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from olasis.search import normalise_query, paginate
+
+
+def test_normalise_query_keeps_case():
+    assert normalise_query("  solar   AND\twind ") == "solar AND wind"
+
+
+@pytest.mark.parametrize(
+    "page, expected_items, has_next",
+    [(1, list(range(6)), True), (3, [12, 13], False), (4, [], False)],
+)
+def test_paginate(page, expected_items, has_next):
+    items, info = paginate(list(range(14)), page, per_page=6)
+
+    assert items == expected_items
+    assert info == {
+        "total": 14,
+        "total_pages": 3,
+        "has_next": has_next,
+        "has_prev": page > 1,
+    }
@@ -0,0 +1,33 @@
+"""Tests for the ORCID specialist search."""
+
+from __future__ import annotations
+
+from olasis import specialists
+
+
+def test_record_names_are_fetched_for_the_first_ten(monkeypatch):
+    paths = [f"0000-0000-0000-{i:04d}" for i in range(12)]
+    fetched: list[str] = []
+
+    def fake_http_get(url, *, headers=None, params=None, timeout=10.0):
+        if url == specialists.ORCID_SEARCH_URL:
+            return {"result": [{"orcid-identifier": {"path": p}} for p in paths]}
+        path = url.rsplit("/", 1)[-1]
+        fetched.append(path)
+        return {
+            "person": {
+                "name": {
+                    "given-names": {"value": "Ana"},
+                    "family-name": {"value": path[-2:]},
+                }
+            }
+        }
+
+    monkeypatch.setattr(specialists, "http_get", fake_http_get)
+
+    results = specialists.search_specialists("solar", rows=12)
+
+    assert [r["orcid"] for r in results] == paths
+    assert sorted(fetched) == paths[:10]
+    assert results[3]["full_name"] == "Ana 03"
+    assert results[11]["full_name"] == "Pesquisador 0011"
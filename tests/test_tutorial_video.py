@@ -0,0 +1,118 @@
+"""Regression tests for tutorial video streaming and range support."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+
+import pytest
+
+
+@pytest.fixture()
+def app_module():
+    if "app" in sys.modules:
+        del sys.modules["app"]
+    return importlib.import_module("app")
+
+
+def _video_size(module, lang: str) -> int:
+    return module._resolve_tutorial_path(lang)[1]
+
+
+def test_plain_get_returns_full_content(app_module):
+    """A request without Range must be a 200 covering the whole file."""
+
+    size = _video_size(app_module, "en")
+
+    with app_module.app.test_client() as client:
+        response = client.head("/media/tutorial/en")
+
+    assert response.status_code == 200
+    assert response.headers["Content-Length"] == str(size)
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert "Content-Range" not in response.headers
+
+
+def test_explicit_range_is_honoured(app_module):
+    """Closed ranges are served exactly, even beyond the open-ended cap."""
+
+    size = _video_size(app_module, "pt")
+    end = app_module._MAX_RANGE_CHUNK_SIZE + 1023
+
+    with app_module.app.test_client() as client:
+        response = client.head(
+            "/media/tutorial/pt", headers={"Range": f"bytes=0-{end}"}
+        )
+
+    assert response.status_code == 206
+    assert response.headers["Content-Range"] == f"bytes 0-{end}/{size}"
+    assert response.headers["Content-Length"] == str(end + 1)
+
+
+def test_open_ended_range_is_bounded(app_module):
+    size = _video_size(app_module, "es")
+    cap = app_module._MAX_RANGE_CHUNK_SIZE
+
+    with app_module.app.test_client() as client:
+        response = client.head("/media/tutorial/es", headers={"Range": "bytes=100-"})
+
+    assert response.status_code == 206
+    assert response.headers["Content-Range"] == f"bytes 100-{100 + cap - 1}/{size}"
+
+
+def test_range_body_matches_file(app_module):
+    path = app_module._resolve_tutorial_path("en")[0]
+    expected = path.read_bytes()[10:200010]
+
+    with app_module.app.test_client() as client:
+        response = client.get("/media/tutorial/en", headers={"Range": "bytes=10-200009"})
+
+    assert response.status_code == 206
+    assert response.data == expected
+
+
+def test_unsatisfiable_range(app_module):
+    size = _video_size(app_module, "en")
+
+    with app_module.app.test_client() as client:
+        response = client.get(
+            "/media/tutorial/en", headers={"Range": f"bytes={size}-"}
+        )
+
+    assert response.status_code == 416
+    assert response.headers["Content-Range"] == f"bytes */{size}"
+
+
+def test_revalidation_returns_not_modified(app_module):
+    with app_module.app.test_client() as client:
+        first = client.head("/media/tutorial/en")
+        etag = first.headers["ETag"]
+        revalidated = client.get("/media/tutorial/en", headers={"If-None-Match": etag})
+
+    assert first.headers["Cache-Control"] == "public, max-age=86400"
+    assert "Last-Modified" in first.headers
+    assert revalidated.status_code == 304
+    assert revalidated.data == b""
+
+
+def test_unknown_language_is_404(app_module):
+    with app_module.app.test_client() as client:
+        response = client.get("/media/tutorial/fr")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("bytes=0-99", (0, 99)),
+        ("bytes=500-", (500, None)),
+        ("bytes=0-99,200-299", (0, 99)),
+        ("bytes=-500", None),
+        ("bytes=a-1", None),
+        ("bytes=1-b", None),
+        ("items=0-1", None),
+    ],
+)
+def test_parse_range_header(app_module, header, expected):
+    assert app_module._parse_range_header(header) == expected